@@ -15,25 +15,34 @@ import subprocess
 import shutil
 import tempfile
 import copy
-from dataclasses import dataclass, field, replace
-from typing import Callable, Final, Dict, Any, Optional, List, TypeVar, Set
+import queue
+from dataclasses import dataclass, field, fields, replace
+from typing import Callable, Final, Dict, Any, Optional, List, Tuple, TypeVar
 from pathlib import Path
-from functools import wraps
+from collections import deque
+from functools import lru_cache, wraps
+from itertools import count, groupby
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
 import shlex
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QPushButton, QLineEdit, QLabel, QComboBox, QFileDialog,
-    QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar,
+    QTableWidget, QTableWidgetItem, QHeaderView,
     QMessageBox, QFrame, QScrollArea, QGroupBox, QFormLayout, 
     QCheckBox, QPlainTextEdit, QSplitter, QTabWidget, QRadioButton, 
     QButtonGroup, QAbstractItemView, QMenu, QDialog, QDialogButtonBox,
-    QTableView
+    QTableView, QSpinBox, QStyledItemDelegate, QStyleOptionViewItem, QStyleOptionProgressBar,
+    QStyleOptionButton, QStyle
 )
-from PyQt6.QtCore import Qt, QObject, pyqtSignal, QThreadPool, pyqtSlot, QUrl, QRunnable, QTimer, QAbstractTableModel, QModelIndex, QSettings
-from PyQt6.QtGui import QColor, QPixmap, QFont, QTextCursor, QTextCharFormat, QDesktopServices, QPalette, QAction, QCloseEvent, QImage
+from PyQt6.QtCore import Qt, QObject, QCoreApplication, pyqtSignal, QThreadPool, pyqtSlot, QUrl, QRunnable, QTimer, QAbstractTableModel, QAbstractItemModel, QModelIndex, QPersistentModelIndex, QSettings, QSize, QEvent
+from PyQt6.QtGui import QColor, QPixmap, QFont, QTextCursor, QTextCharFormat, QDesktopServices, QPalette, QAction, QCloseEvent, QShowEvent, QImage, QPainter
 from PyQt6 import sip
 
+if sys.version_info < (3, 10):
+    sys.exit("[Ambiente] Python 3.10 ou superior é necessário (dataclasses com slots=True).")
+
 import processamento as proc
 
 PROJECT_DIR = str(Path(__file__).parent.absolute())
@@ -45,17 +54,75 @@ T = TypeVar('T')
 APP_NAME: Final[str] = "SoundStream Pro"
 VERSION: Final[str] = "7.10.3"
 DEFAULT_DOWNLOAD_DIR: Final[Path] = Path.home() / "Downloads"
-MAX_CONCURRENT_DOWNLOADS: Final[int] = 3
+MAX_CONCURRENT_DOWNLOADS: Final[int] = 6
+MAX_CONCURRENT_ANALYSES: Final[int] = 4
+DEFAULT_OUTPUT_TEMPLATE: Final[str] = "%(title)s - %(artist)s.%(ext)s"
 
 MB_CONTACT = os.environ.get("MB_CONTACT_EMAIL", "contact@soundstream.app")
 MB_USER_AGENT = f"{APP_NAME}/{VERSION} ( {MB_CONTACT} )"
 
 _SHARED_SSL_CTX: ssl.SSLContext = ssl.create_default_context()
 _TMPL_PATTERN: Final = re.compile(r'%\(([^)]+)\)s')
-_UNSAFE_CHARS: Final = re.compile(r'[<>:"/\\|?*]')
+_DEFAULT_FILENAME_TMPL: Final[str] = DEFAULT_OUTPUT_TEMPLATE.removesuffix(".%(ext)s")
+_UNSAFE_CHARS: Final = str.maketrans('', '', '<>:"/\\|?*')
 _WHITESPACE: Final = re.compile(r'\s+')
-
-@dataclass(frozen=True)
+_LUCENE_SPECIAL: Final = re.compile(r'([+\-!(){}\[\]^"~*?:\\])')
+_AUDIO_CONTAINERS: Final[tuple[str, ...]] = ("flac", "mp3", "wav", "m4a", "opus")
+_VIDEO_CONTAINERS: Final[tuple[str, ...]] = ("mp4", "mkv", "webm", "avi")
+_VIDEO_CONTAINER_SET: Final[frozenset[str]] = frozenset(_VIDEO_CONTAINERS)
+_LOSSLESS_CONTAINERS: Final[frozenset[str]] = frozenset({"flac", "wav"})
+_AUDIO_SOURCE_MARKERS: Final[tuple[str, ...]] = ("spotify", "music.youtube", "soundcloud")
+_AUDIO_TARGET_MARKERS: Final[tuple[str, ...]] = ("ytmsearch", "ytsearch", "music.youtube", "soundcloud")
+_PER_JOB_CONFIG_FIELDS: Final[frozenset[str]] = frozenset({
+    'job_id', 'url', 'output_path', 'media_type', 'format_container', 'meta_title', 'meta_artist',
+    'meta_album', 'meta_genre', 'meta_date', 'meta_desc', 'spotify_thumb_url', 'duration'
+})
+_JOB_CONFIG_KEYS: Final[tuple[str, ...]] = tuple(
+    f.name for f in fields(proc.DownloadJobConfig) if f.name not in _PER_JOB_CONFIG_FIELDS
+)
+_SESSION_TAG: Final[str] = f"{int(time.time()):x}{os.getpid():x}"
+_QUEUE_COLUMN_WIDTHS: Final[tuple[tuple[int, int], ...]] = ((1, 110), (2, 200), (3, 160), (4, 120))
+_DOWN_PREFIX: Final[str] = "▼ "
+_STATUS_DONE_COLOR: Final[QColor] = QColor(0x4c, 0xaf, 0x50)
+_STATUS_ERROR_COLOR: Final[QColor] = QColor(0xd3, 0x2f, 0x2f)
+_STATUS_CANCELLING_COLOR: Final[QColor] = QColor(0xff, 0x98, 0x00)
+_TERMINAL_STATUSES: Final[frozenset[str]] = frozenset({"✔ Concluído", "✘ Erro", "Cancelado"})
+_DISPLAY_ROLE: Final[Qt.ItemDataRole] = Qt.ItemDataRole.DisplayRole
+_USER_ROLE: Final[Qt.ItemDataRole] = Qt.ItemDataRole.UserRole
+_FOREGROUND_ROLE: Final[Qt.ItemDataRole] = Qt.ItemDataRole.ForegroundRole
+_CHECK_STATE_ROLE: Final[Qt.ItemDataRole] = Qt.ItemDataRole.CheckStateRole
+_ALIGNMENT_ROLE: Final[Qt.ItemDataRole] = Qt.ItemDataRole.TextAlignmentRole
+_ALIGN_CENTER: Final[int] = Qt.AlignmentFlag.AlignCenter.value
+_CHECKED: Final[int] = Qt.CheckState.Checked.value
+_UNCHECKED: Final[int] = Qt.CheckState.Unchecked.value
+_VIDEO_BITRATE_LADDER: Final[tuple[tuple[tuple[str, ...], int], ...]] = (
+    (("4k", "2160"), 15000), (("1440",), 8000), (("1080",), 5000), (("720",), 2500), (("480",), 1000)
+)
+_LOSSLESS_BITRATE_KBPS: Final[Dict[str, int]] = {"flac": 900, "wav": 1411}
+
+@lru_cache(maxsize=16)
+def _video_bitrate_kbps(quality: str) -> int:
+    q = quality.lower()
+    return next((kbps for keys, kbps in _VIDEO_BITRATE_LADDER if any(k in q for k in keys)), 500)
+
+@lru_cache(maxsize=32)
+def _compile_template(tmpl: str) -> tuple[tuple[str, Optional[str]], ...]:
+    parts: List[tuple[str, Optional[str]]] = []
+    pos = 0
+    for m in _TMPL_PATTERN.finditer(tmpl):
+        parts.append((tmpl[pos:m.start()], m.group(1)))
+        pos = m.end()
+    parts.append((tmpl[pos:], None))
+    return tuple(parts)
+
+def _render_template(tmpl: str, mapping: Dict[str, Any]) -> str:
+    out: List[str] = []
+    for literal, key in _compile_template(tmpl):
+        out.append(literal)
+        if key is not None: out.append(str(mapping.get(key, f"%({key})s")).translate(_UNSAFE_CHARS))
+    return _WHITESPACE.sub(' ', ''.join(out)).strip(' -_')
+
+@dataclass(frozen=True, slots=True)
 class EntityStub:
     original_id: str = ''
     title: str = ''
@@ -83,12 +150,13 @@ class EntityStub:
         hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}" if hours > 0 else f"{minutes:02d}:{seconds:02d}"
 
-@dataclass
+@dataclass(slots=True)
 class JobRecord:
     config: proc.DownloadJobConfig
     state: proc.DownloadJobState
     runnable: Optional[proc.DownloadWorker] = None
     is_terminal: bool = False
+    cancelled: bool = False
 
 def with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0) -> Callable:
     def decorator(func: Callable) -> Callable:
@@ -105,7 +173,7 @@ def with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0) -> C
                         if attempt >= max_retries:
                             raise
                         delay = base_delay * (2 ** attempt)
-                        logging.warning(f"[Network] Interrupção prematura. Retentativa {attempt}/{max_retries} pendente (Atraso: {delay}s).")
+                        logging.warning("[Network] Interrupção prematura. Retentativa %d/%d pendente (Atraso: %ss).", attempt, max_retries, delay)
                         time.sleep(delay)
                     else:
                         raise
@@ -114,12 +182,17 @@ def with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0) -> C
     return decorator
 
 class UrlResolver:
-    VALID_MEDIA_REGEX = re.compile(r'^(https?://)?(www\.)?(youtube\.com|youtu\.be|music\.youtube\.com|vimeo\.com|soundcloud\.com|open\.spotify\.com)/.+$')
+    MEDIA_HOSTS: Final[frozenset[str]] = frozenset({"youtube.com", "youtu.be", "music.youtube.com", "vimeo.com", "soundcloud.com", "open.spotify.com"})
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def validate_url(url: str) -> bool:
         if url.startswith(("ytsearch", "ytmsearch")): return True
-        return bool(UrlResolver.VALID_MEDIA_REGEX.match(url))
+        scheme, sep, rest = url.partition("://")
+        if not sep: rest = url
+        elif scheme not in ("http", "https"): return False
+        host, slash, path = rest.removeprefix("www.").partition("/")
+        return bool(slash and path) and host in UrlResolver.MEDIA_HOSTS and "\n" not in path
 
     @staticmethod
     def resolve_download_url(entity: Any, target_url: str) -> str:
@@ -150,10 +223,9 @@ class CookieImportWorker(QRunnable):
                 return
 
             try:
-                with open(self.source_path, "r", encoding="utf-8", errors="ignore") as f:
-                    if "# Netscape HTTP Cookie File" not in f.read(120):
-                        self.signals.error.emit("A assinatura léxica do ficheiro não corresponde à RFC 'Netscape HTTP Cookie File'. A importação foi abortada.")
-                        return
+                if not proc.SessionStateManager.has_netscape_signature(self.source_path):
+                    self.signals.error.emit("A assinatura léxica do ficheiro não corresponde à RFC 'Netscape HTTP Cookie File'. A importação foi abortada.")
+                    return
             except PermissionError as e:
                 self.signals.error.emit(f"Falha de I/O [WinError 32]: O ficheiro matriz encontra-se bloqueado por outro processo em execução (ex: Google Chrome, Edge). Encerre-o e tente novamente. Detalhe: {e}")
                 return
@@ -162,6 +234,7 @@ class CookieImportWorker(QRunnable):
                 tmp_target = target_path.with_suffix('.tmp_import')
                 shutil.copy2(self.source_path, tmp_target)
                 os.replace(tmp_target, target_path)
+                proc.SessionStateManager.invalidate_signature_cache()
 
             self.signals.success.emit(str(target_path.absolute()))
         except Exception as e:
@@ -188,7 +261,7 @@ class MetadataDSPWorker(QRunnable):
             file_size = self.original_filepath.stat().st_size
             is_stream_copy = "-c copy" in " ".join(self.cmd)
             timeout_sec = 300 if is_stream_copy else max(120, int(file_size / (512 * 1024)))
-            subprocess.run(self.cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True, startupinfo=startupinfo, timeout=timeout_sec)
+            subprocess.run(self.cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True, startupinfo=startupinfo, creationflags=proc.SUBPROCESS_FLAGS, close_fds=True, timeout=timeout_sec)
             
             if self.target_filepath.exists() and self.target_filepath.absolute() != self.original_filepath.absolute():
                 self.target_filepath.unlink(missing_ok=True)
@@ -260,7 +333,7 @@ class LocalMetadataEditorDialog(QDialog):
             self.reject()
             return
             
-        new_stem = _UNSAFE_CHARS.sub('', self.in_filename.text()).strip() or "output_modificado"
+        new_stem = self.in_filename.text().translate(_UNSAFE_CHARS).strip() or "output_modificado"
         target_filepath = self.filepath.with_name(f"{new_stem}{self.filepath.suffix}")
         temp_out = self.filepath.with_suffix(f".temp_{uuid.uuid4().hex[:6]}{self.filepath.suffix}")
         
@@ -321,6 +394,7 @@ class EngineFlagsDialog(QDialog):
             EngineFlag("--limit-rate", "Limitar largura de banda (ex: 50K, 2M)", requires_input=True, category="Rede e Transporte"),
             EngineFlag("--proxy", "URI de Proxy HTTP/SOCKS", requires_input=True, category="Rede e Transporte"),
             EngineFlag("--socket-timeout", "Tempo limite de resposta (Time-to-Live) em segundos", requires_input=True, category="Rede e Transporte"),
+            EngineFlag("--concurrent-fragments", "Fragmentos HLS/DASH descarregados em paralelo por tarefa", requires_input=True, category="Rede e Transporte"),
             EngineFlag("--geo-bypass", "Contornar restrições geográficas via cabeçalhos injetados", category="Evasão de Restrições"),
             EngineFlag("--cookies-from-browser", "Extrair matriz de estado (Cookies) do navegador", requires_input=True, category="Evasão de Restrições"),
             EngineFlag("--user-agent", "Falsificação estrita da string de User-Agent", requires_input=True, category="Evasão de Restrições"),
@@ -399,7 +473,7 @@ class EngineFlagsDialog(QDialog):
         if not self._current_flags: return
         try: tokens = shlex.split(self._current_flags)
         except ValueError as e:
-            logging.warning(f"[Lexer] Falha ao efetuar parse da sintaxe AST: {e}")
+            logging.warning("[Lexer] Falha ao efetuar parse da sintaxe AST: %s", e)
             tokens = self._current_flags.split()
 
         unknown = []
@@ -464,7 +538,7 @@ class DialogThumbnailWorker(QRunnable):
             except urllib.error.HTTPError as e:
                 if e.code in (404, 400, 403, 503): continue 
             except Exception as e:
-                logging.debug(f"[Grid] Falha tolerável na resolução de miniatura rápida: {e}")
+                logging.debug("[Grid] Falha tolerável na resolução de miniatura rápida: %s", e)
                 continue
 
 class APIRateLimiter:
@@ -480,15 +554,13 @@ class APIRateLimiter:
         self._tokens = min(self.capacity, self._tokens + (now - self._last_update) * self.rate)
         self._last_update = now
 
-    def _has_token(self) -> bool:
-        self._refill()
-        return self._tokens >= 1.0
-
     def wait(self) -> None:
         with self._lock:
-            self._lock.wait_for(self._has_token)
+            self._refill()
+            while self._tokens < 1.0:
+                self._lock.wait((1.0 - self._tokens) / self.rate)
+                self._refill()
             self._tokens -= 1.0
-            self._lock.notify_all()
 
 mb_rate_limiter = APIRateLimiter(rate=1.0, capacity=1)
 
@@ -529,6 +601,7 @@ class ThemeManager:
         return palette
 
     @staticmethod
+    @lru_cache(maxsize=2)
     def get_stylesheet(is_dark: bool) -> str:
         qss = """
             QWidget {{ font-family: 'Segoe UI', 'Roboto', sans-serif; font-size: 13px; }}
@@ -562,14 +635,22 @@ class ThemeManager:
         return qss.format_map(tokens)
 
 class QtLogHandler(logging.Handler, QObject):
-    log_record = pyqtSignal(str, int)
-    def __init__(self) -> None:
+    log_pending = pyqtSignal()
+    def __init__(self, capacity: int = 5000) -> None:
         logging.Handler.__init__(self)
         QObject.__init__(self)
         self.setFormatter(logging.Formatter('[%(asctime)s] %(name)s: %(message)s', datefmt='%H:%M:%S'))
+        self._buffer: deque[tuple[str, int]] = deque(maxlen=capacity)
     def emit(self, record: logging.LogRecord) -> None:
-        msg = self.format(record)
-        self.log_record.emit(msg, record.levelno)
+        was_empty = not self._buffer
+        # Rendered now: buffered records would otherwise pin their args (exceptions, frames) for the session.
+        self._buffer.append((self.format(record), record.levelno))
+        if was_empty: self.log_pending.emit()
+    def drain(self) -> List[tuple[str, int]]:
+        with self.lock:
+            records = list(self._buffer)
+            self._buffer.clear()
+        return records
 
 class LogViewerWidget(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
@@ -580,6 +661,11 @@ class LogViewerWidget(QWidget):
         self.fmt_error = QTextCharFormat()
         self.fmt_critical = QTextCharFormat()
         self.fmt_critical.setFontWeight(QFont.Weight.Bold)
+        self._source: Optional[Callable[[], List[tuple[str, int]]]] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -601,7 +687,8 @@ class LogViewerWidget(QWidget):
         self.text_edit = QPlainTextEdit(self)
         self.text_edit.setReadOnly(True)
         self.text_edit.setObjectName("LogConsole")
-        self.text_edit.setMaximumBlockCount(2000) 
+        self.text_edit.setMaximumBlockCount(5000)
+        self.text_edit.setUndoRedoEnabled(False)
         
         layout.addLayout(header_layout)
         layout.addWidget(self.text_edit)
@@ -620,23 +707,47 @@ class LogViewerWidget(QWidget):
             self.fmt_error.setForeground(QColor("#d32f2f"))  
             self.fmt_critical.setForeground(QColor("#b71c1c"))
 
-    @pyqtSlot(str, int)
-    def append_log(self, msg: str, levelno: int) -> None:
+    def _format_for(self, levelno: int) -> QTextCharFormat:
+        if levelno >= logging.CRITICAL: return self.fmt_critical
+        if levelno >= logging.ERROR: return self.fmt_error
+        if levelno >= logging.WARNING: return self.fmt_warning
+        if levelno == logging.INFO: return self.fmt_info
+        return self.fmt_debug
+
+    def attach_source(self, drain: Callable[[], List[tuple[str, int]]]) -> None:
+        self._source = drain
+
+    @pyqtSlot()
+    def schedule_flush(self) -> None:
+        if self.isVisible() and not self._flush_timer.isActive(): self._flush_timer.start()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self.schedule_flush()
+
+    @pyqtSlot()
+    def _flush_pending(self) -> None:
+        if not self.isVisible(): return
+        records = self._source() if self._source else []
+        if not records: return
         cursor = self.text_edit.textCursor()
+        cursor.beginEditBlock()
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        if levelno >= logging.CRITICAL: cursor.setCharFormat(self.fmt_critical)
-        elif levelno >= logging.ERROR: cursor.setCharFormat(self.fmt_error)
-        elif levelno >= logging.WARNING: cursor.setCharFormat(self.fmt_warning)
-        elif levelno == logging.INFO: cursor.setCharFormat(self.fmt_info)
-        else: cursor.setCharFormat(self.fmt_debug)
-        cursor.insertText(msg + "\n")
+        for levelno, run in groupby(records, key=itemgetter(1)):
+            cursor.setCharFormat(self._format_for(levelno))
+            cursor.insertText("".join(f"{msg}\n" for msg, _ in run))
+        cursor.endEditBlock()
         self.text_edit.setTextCursor(cursor)
         self.text_edit.ensureCursorVisible()
 
     def clear_logs(self) -> None:
+        if self._source: self._source()
         self.text_edit.clear()
 
 class PlaylistTableModel(QAbstractTableModel):
+    _CELL_FLAGS: Final[Qt.ItemFlag] = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    _CHECK_FLAGS: Final[Qt.ItemFlag] = _CELL_FLAGS | Qt.ItemFlag.ItemIsUserCheckable
+
     def __init__(self, entities: List[Any], parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
         self._entities = entities
@@ -654,32 +765,29 @@ class PlaylistTableModel(QAbstractTableModel):
         row, col = index.row(), index.column()
         entity = self._entities[row]
 
-        if role == Qt.ItemDataRole.DisplayRole:
+        if role == _DISPLAY_ROLE:
             if col == 1: return entity.title
             if col == 2: return entity.artist
             if col == 3: return entity.album
             if col == 4: return entity.display_duration
-        elif role == Qt.ItemDataRole.CheckStateRole and col == 0:
-            return Qt.CheckState.Checked.value if self._checked_states[row] else Qt.CheckState.Unchecked.value
-        elif role == Qt.ItemDataRole.TextAlignmentRole and col in (0, 4):
-            return Qt.AlignmentFlag.AlignCenter.value
+        elif role == _CHECK_STATE_ROLE and col == 0:
+            return _CHECKED if self._checked_states[row] else _UNCHECKED
+        elif role == _ALIGNMENT_ROLE and col in (0, 4):
+            return _ALIGN_CENTER
         return None
 
     def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
-        if role == Qt.ItemDataRole.CheckStateRole and index.column() == 0:
-            self._checked_states[index.row()] = (value == Qt.CheckState.Checked.value)
+        if role == _CHECK_STATE_ROLE and index.column() == 0:
+            self._checked_states[index.row()] = (value == _CHECKED)
             self.dataChanged.emit(index, index, [role])
             return True
         return False
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlag:
-        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-        if index.column() == 0:
-            flags |= Qt.ItemFlag.ItemIsUserCheckable
-        return flags
+        return self._CHECK_FLAGS if index.column() == 0 else self._CELL_FLAGS
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
-        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+        if orientation == Qt.Orientation.Horizontal and role == _DISPLAY_ROLE:
             return self._headers[section]
         return None
 
@@ -688,11 +796,174 @@ class PlaylistTableModel(QAbstractTableModel):
         if self._entities:
             top_left = self.index(0, 0)
             bottom_right = self.index(len(self._entities) - 1, 0)
-            self.dataChanged.emit(top_left, bottom_right, [Qt.ItemDataRole.CheckStateRole])
+            self.dataChanged.emit(top_left, bottom_right, [_CHECK_STATE_ROLE])
 
     def get_selected_entities(self) -> List[Any]:
         return [ent for i, ent in enumerate(self._entities) if self._checked_states[i]]
     
+@dataclass(slots=True)
+class QueueRow:
+    job_id: str
+    title: str
+    format_label: str
+    status: str = "Na Fila"
+    progress: int = 0
+    status_color: Optional[QColor] = None
+    action: str = "Parar"
+
+class DownloadQueueModel(QAbstractTableModel):
+    COL_TITLE, COL_FORMAT, COL_STATUS, COL_PROGRESS, COL_ACTION = range(5)
+    ProgressRole: Final[int] = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: List[QueueRow] = []
+        self._row_index: Dict[str, int] = {}
+        self._headers = ["Ficheiro / Título", "Formato", "Estado", "Progresso", "Ações"]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid(): return None
+        row, col = self._rows[index.row()], index.column()
+
+        if role == _DISPLAY_ROLE:
+            if col == self.COL_TITLE: return row.title
+            if col == self.COL_FORMAT: return row.format_label
+            if col == self.COL_STATUS: return row.status
+            if col == self.COL_PROGRESS: return f"{row.progress}%"
+            if col == self.COL_ACTION: return row.action
+        elif role == self.ProgressRole and col == self.COL_PROGRESS:
+            return row.progress
+        elif role == _FOREGROUND_ROLE and col == self.COL_STATUS:
+            return row.status_color
+        elif role == _USER_ROLE:
+            return row.job_id
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == _DISPLAY_ROLE:
+            return self._headers[section]
+        return None
+
+    def row_of(self, job_id: str) -> int:
+        return self._row_index.get(job_id, -1)
+
+    def job_id_at(self, row: int) -> str:
+        return self._rows[row].job_id
+
+    def status_of(self, job_id: str) -> str:
+        return self._rows[row].status if (row := self.row_of(job_id)) >= 0 else ""
+
+    def job_ids_with_status(self, statuses: frozenset[str]) -> List[str]:
+        return [r.job_id for r in self._rows if r.status in statuses]
+
+    def add_jobs(self, entries: List[Tuple[str, str, str]]) -> None:
+        if not entries: return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        for row, (job_id, title, format_label) in enumerate(entries, first):
+            self._rows.append(QueueRow(job_id, title, format_label))
+            self._row_index[job_id] = row
+        self.endInsertRows()
+
+    def remove_job(self, job_id: str) -> None:
+        row = self._row_index.pop(job_id, -1)
+        if row < 0: return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        for i in range(row, len(self._rows)):
+            self._row_index[self._rows[i].job_id] = i
+        self.endRemoveRows()
+
+    def _update(self, job_id: str, col: int, role: int, **changes: Any) -> None:
+        if (row := self.row_of(job_id)) < 0: return
+        entry = self._rows[row]
+        if all(getattr(entry, k) == v for k, v in changes.items()): return
+        for k, v in changes.items(): setattr(entry, k, v)
+        idx = self.index(row, col)
+        self.dataChanged.emit(idx, idx, [role])
+
+    def set_title(self, job_id: str, title: str) -> None:
+        self._update(job_id, self.COL_TITLE, _DISPLAY_ROLE, title=title)
+
+    def set_progress(self, job_id: str, pct: float) -> None:
+        self._update(job_id, self.COL_PROGRESS, self.ProgressRole, progress=int(pct))
+
+    def set_status(self, job_id: str, status: str, color: Optional[QColor] = None) -> None:
+        if color is None: self._update(job_id, self.COL_STATUS, _DISPLAY_ROLE, status=status)
+        else: self._update(job_id, self.COL_STATUS, _DISPLAY_ROLE, status=status, status_color=color)
+
+    def set_action(self, job_id: str, action: str) -> None:
+        self._update(job_id, self.COL_ACTION, _DISPLAY_ROLE, action=action)
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(4, 4, -4, -4)
+        bar.minimum, bar.maximum = 0, 100
+        bar.progress = int(index.data(DownloadQueueModel.ProgressRole) or 0)
+        bar.text = f"{bar.progress}%"
+        bar.textVisible = True
+        bar.state = option.state | QStyle.StateFlag.State_Horizontal
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter, option.widget)
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    clicked = pyqtSignal(str, str)
+    _ACTION_OBJECT_NAMES: Final[Dict[str, str]] = {"Parar": "Destructive", "Repetir": "PrimaryAction"}
+
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        self._pressed = QPersistentModelIndex()
+        self._style_proxies: Dict[str, QPushButton] = {}
+        for name in ("", *self._ACTION_OBJECT_NAMES.values()):
+            proxy = QPushButton(parent)
+            proxy.setObjectName(name)
+            proxy.hide()
+            self._style_proxies[name] = proxy
+        if isinstance(parent, QAbstractItemView): parent.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.MouseButtonPress: self._pressed = QPersistentModelIndex()
+        return False
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        btn = QStyleOptionButton()
+        btn.rect = option.rect.adjusted(4, 2, -4, -2)
+        btn.text = index.data(_DISPLAY_ROLE) or ""
+        btn.state = QStyle.StateFlag.State_Enabled | (option.state & QStyle.StateFlag.State_MouseOver)
+        held = self._pressed == index and QApplication.mouseButtons() & Qt.MouseButton.LeftButton
+        btn.state |= QStyle.StateFlag.State_Sunken if held else QStyle.StateFlag.State_Raised
+        proxy = self._style_proxies[self._ACTION_OBJECT_NAMES.get(btn.text, "")]
+        proxy.ensurePolished()
+        btn.palette = proxy.palette()
+        btn.fontMetrics = proxy.fontMetrics()
+        proxy.style().drawControl(QStyle.ControlElement.CE_PushButton, btn, painter, proxy)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        text = index.data(_DISPLAY_ROLE) or ""
+        return QSize(option.fontMetrics.horizontalAdvance(text) + 32, option.fontMetrics.height() + 12)
+
+    def editorEvent(self, event: QEvent, model: QAbstractItemModel, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        etype = event.type()
+        if etype not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease, QEvent.Type.MouseButtonDblClick):
+            return super().editorEvent(event, model, option, index)
+        if event.button() != Qt.MouseButton.LeftButton: return False
+        inside = option.rect.contains(event.position().toPoint())
+        if etype != QEvent.Type.MouseButtonRelease:
+            if inside: self._pressed = QPersistentModelIndex(index)
+            return inside
+        pressed, self._pressed = self._pressed, QPersistentModelIndex()
+        if inside and pressed == index:
+            self.clicked.emit(index.data(_USER_ROLE), index.data(_DISPLAY_ROLE))
+            return True
+        return False
+
 class PlaylistStagingDialog(QDialog):
     def __init__(self, entities: List[Any], parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -761,7 +1032,7 @@ class MusicBrainzWorker(QRunnable):
         self.signals = MusicBrainzSignals()
 
     def _escape_lucene(self, text: str) -> str:
-        return re.sub(r'([+\-!(){}\[\]^"~*?:\\])', r'\\\1', text)
+        return _LUCENE_SPECIAL.sub(r'\\\1', text)
 
     @pyqtSlot()
     def run(self) -> None:
@@ -783,7 +1054,7 @@ class MusicBrainzWorker(QRunnable):
             req = urllib.request.Request(url, headers=headers)
             
             mb_rate_limiter.wait()
-            logging.debug(f"[Network] A consultar AST Lucene MusicBrainz: {url}")
+            logging.debug("[Network] A consultar AST Lucene MusicBrainz: %s", url)
             
             with urllib.request.urlopen(req, timeout=15, context=_SHARED_SSL_CTX) as response:
                 data = json.loads(response.read().decode('utf-8'))
@@ -807,13 +1078,13 @@ class MusicBrainzWorker(QRunnable):
             self.signals.results_ready.emit(candidates)
             
         except urllib.error.URLError as e:
-            logging.error(f"[Network] Falha na resolução de soquetes: {e}")
+            logging.error("[Network] Falha na resolução de soquetes: %s", e)
             self.signals.error.emit(str(e))
         except json.JSONDecodeError as e:
-            logging.error(f"[Parser] Árvore JSON corrompida: {e}")
+            logging.error("[Parser] Árvore JSON corrompida: %s", e)
             self.signals.error.emit("A resposta do servidor não é um JSON válido.")
         except Exception as e:
-            logging.critical(f"[System] Exceção fatal na camada de busca: {e}", exc_info=True)
+            logging.critical("[System] Exceção fatal na camada de busca: %s", e, exc_info=True)
             self.signals.error.emit(str(e))
 
 class CoverArtWorker(QRunnable):
@@ -877,7 +1148,7 @@ class CoverArtWorker(QRunnable):
                 self.signals.error.emit("Falha no decodificador de matriz de bits da imagem.")
 
         except Exception as e:
-            logging.error(f"[System] Colapso na propagação da árvore de capa: {str(e)}")
+            logging.error("[System] Colapso na propagação da árvore de capa: %s", e)
             self.signals.error.emit(f"Falha na alocação da árvore de arte: {str(e)}")
 
 class MetadataSelectionDialog(QDialog):
@@ -973,7 +1244,7 @@ class InspectorPanel(QFrame):
         self.thumb_lbl.setFixedSize(320, 180)
         self.thumb_lbl.setObjectName("ThumbLabel")
         self.thumb_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.thumb_lbl.setScaledContents(True)
+        self.thumb_lbl.setScaledContents(False)
         
         self.stats_lbl = QLabel("Pronto para Analisar", left_col)
         self.stats_lbl.setObjectName("StatsLabel")
@@ -1001,7 +1272,6 @@ class InspectorPanel(QFrame):
         self.btn_grp_type.addButton(self.rb_audio)
         
         self.rb_video.toggled.connect(self._update_ui_mode)
-        self.rb_audio.toggled.connect(self._update_ui_mode)
         
         type_layout.addWidget(self.rb_audio)
         type_layout.addWidget(self.rb_video)
@@ -1139,7 +1409,7 @@ class InspectorPanel(QFrame):
         
         tmpl_layout = QHBoxLayout()
         tmpl_layout.setContentsMargins(0, 0, 0, 0)
-        self.in_output_tmpl = QLineEdit("%(title)s - %(artist)s.%(ext)s", dev_group)
+        self.in_output_tmpl = QLineEdit(DEFAULT_OUTPUT_TEMPLATE, dev_group)
         
         btn_tmpl_help = QPushButton("?", dev_group)
         btn_tmpl_help.setFixedWidth(30)
@@ -1305,13 +1575,8 @@ class InspectorPanel(QFrame):
             'playlist_index': "01"
         }
         
-        def safe_sub(match: re.Match) -> str:
-            val = mapping.get(match.group(1), f"%({match.group(1)})s")
-            return _UNSAFE_CHARS.sub('', str(val))
-            
         try:
-            res = _TMPL_PATTERN.sub(safe_sub, tmpl)
-            res = _WHITESPACE.sub(' ', res).strip(' -_')
+            res = _render_template(tmpl, mapping)
             self.in_filename.setText(res)
             if "%(" in res:
                 self.in_output_tmpl.setStyleSheet("border: 1px solid #ff9800;")
@@ -1405,7 +1670,7 @@ class InspectorPanel(QFrame):
         if sip.isdeleted(self): return
         self.btn_fetch_mb.setEnabled(True)
         self.btn_fetch_mb.setText("Preenchimento Automático (MusicBrainz)")
-        logging.warning(f"Arte ignorada: {err_msg}")
+        logging.warning("Arte ignorada: %s", err_msg)
 
     @pyqtSlot(str)
     def _on_musicbrainz_error(self, err_msg: str) -> None:
@@ -1438,7 +1703,7 @@ class InspectorPanel(QFrame):
             self.in_title.clear(); self.in_artist.clear(); self.in_album.clear()
         
         orig_id = getattr(meta, 'original_id', '')
-        if getattr(meta, 'is_search_query', False) or any(x in str(orig_id) for x in ['ytmsearch', 'ytsearch', 'music.youtube', 'soundcloud']):
+        if getattr(meta, 'is_search_query', False) or any(x in str(orig_id) for x in _AUDIO_TARGET_MARKERS):
             self.rb_audio.setChecked(True)
             self.rb_video.setEnabled(False)
         else:
@@ -1449,7 +1714,13 @@ class InspectorPanel(QFrame):
         self._compute_dynamic_filename()
 
     def set_thumbnail(self, pixmap: QPixmap) -> None:
-        if not sip.isdeleted(self.thumb_lbl): self.thumb_lbl.setPixmap(pixmap)
+        if sip.isdeleted(self.thumb_lbl): return
+        dpr = self.thumb_lbl.devicePixelRatioF()
+        target = self.thumb_lbl.size() * dpr
+        if pixmap.size() != target:
+            pixmap = pixmap.scaled(target, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        pixmap.setDevicePixelRatio(dpr)
+        self.thumb_lbl.setPixmap(pixmap)
 
     def clear_thumbnail(self) -> None:
         if not sip.isdeleted(self.thumb_lbl):
@@ -1459,19 +1730,21 @@ class InspectorPanel(QFrame):
 
     def _update_ui_mode(self) -> None:
         is_video = self.rb_video.isChecked()
-        self.cb_container.blockSignals(True)
-        self.cb_container.clear()
-        self.cb_container.addItems(["mp4", "mkv", "webm", "avi"] if is_video else ["flac", "mp3", "wav", "m4a", "opus"])
-        self.cb_container.blockSignals(False)
+        containers = _VIDEO_CONTAINERS if is_video else _AUDIO_CONTAINERS
+        if tuple(self.cb_container.itemText(i) for i in range(self.cb_container.count())) != containers:
+            self.cb_container.blockSignals(True)
+            self.cb_container.clear()
+            self.cb_container.addItems(containers)
+            self.cb_container.blockSignals(False)
         self.cb_container.setCurrentIndex(0)
         
-        for w in [self.lbl_quality, self.cb_quality, self.lbl_vcodec, self.cb_vcodec, self.lbl_acodec, self.cb_acodec]: w.setVisible(is_video)
-        for w in [self.lbl_abitrate, self.cb_abitrate, self.lbl_asr, self.cb_asr]: w.setVisible(not is_video)
+        for w in (self.lbl_quality, self.cb_quality, self.lbl_vcodec, self.cb_vcodec, self.lbl_acodec, self.cb_acodec): w.setVisible(is_video)
+        for w in (self.lbl_abitrate, self.cb_abitrate, self.lbl_asr, self.cb_asr): w.setVisible(not is_video)
         self.chk_norm.setVisible(not is_video)
         self._on_container_changed(self.cb_container.currentText())
 
     def _on_container_changed(self, fmt: str) -> None:
-        is_lossless = fmt in ['flac', 'wav']
+        is_lossless = fmt in _LOSSLESS_CONTAINERS
         self.cb_abitrate.setEnabled(not is_lossless)
         self.lbl_bitdepth.setVisible(is_lossless)
         self.cb_bitdepth.setVisible(is_lossless)
@@ -1490,10 +1763,9 @@ class InspectorPanel(QFrame):
 
         if total_filesize <= 0 and total_duration > 0:
             if self.rb_video.isChecked():
-                q = self.cb_quality.currentText().lower()
-                bitrate_kbps = 15000 if '4k' in q or '2160' in q else 8000 if '1440' in q else 5000 if '1080' in q else 2500 if '720' in q else 1000 if '480' in q else 500
+                bitrate_kbps = _video_bitrate_kbps(self.cb_quality.currentText())
             else:
-                bitrate_kbps = 900 if self.cb_container.currentText() == 'flac' else 1411 if self.cb_container.currentText() == 'wav' else int(self.cb_abitrate.currentData() or 192)
+                bitrate_kbps = _LOSSLESS_BITRATE_KBPS.get(self.cb_container.currentText()) or int(self.cb_abitrate.currentData() or 192)
             total_filesize = int((bitrate_kbps * 1000 / 8) * total_duration)
 
         html_parts = [
@@ -1516,7 +1788,7 @@ class InspectorPanel(QFrame):
             'video_codec': self.cb_vcodec.currentText().lower(),
             'audio_codec': self.cb_acodec.currentText().lower(),
             'quality_preset': self.cb_quality.currentText(),
-            'audio_bitrate': self.cb_abitrate.currentData() if self.cb_abitrate.isEnabled() else "0",
+            'audio_bitrate': str(self.cb_abitrate.currentData()) if self.cb_abitrate.isEnabled() else "0",
             'audio_sample_rate': 0 if asr == "auto" else int(asr),
             'audio_bit_depth': "auto" if bd == "Auto" else bd, 
             'custom_filename': "" if not self.tabs.isTabEnabled(1) else self.in_filename.text().strip(),
@@ -1529,42 +1801,55 @@ class InspectorPanel(QFrame):
             'meta_genre': self.in_genre.text(),
             'meta_date': self.in_date.text(),
             'meta_desc': self.in_desc.toPlainText(),
-            'embed_meta': self.chk_meta.isChecked(),
-            'embed_thumb': self.chk_thumb.isChecked(),
+            'embed_metadata': self.chk_meta.isChecked(),
+            'embed_thumbnail': self.chk_thumb.isChecked(),
             'embed_subs': self.chk_subs.isChecked(),
-            'norm_audio': self.chk_norm.isChecked(),
-            'use_cookies': self.chk_cookies.isChecked(),
+            'normalize_audio': self.chk_norm.isChecked(),
+            'use_browser_cookies': self.chk_cookies.isChecked(),
             'local_custom_cover': self._local_custom_cover_path
         }
 
 class MainWindow(QMainWindow):
-    def __init__(self) -> None:
+    def __init__(self, log_handler: Optional[QtLogHandler] = None) -> None:
         super().__init__()
         self.setWindowTitle(f"{APP_NAME} {VERSION}")
         self.resize(1200, 900)
         self.setMinimumSize(1000, 700)
         
-        self.thread_pool = QThreadPool.globalInstance()
-        self.thread_pool.setMaxThreadCount(MAX_CONCURRENT_DOWNLOADS)
+        self.settings = QSettings("SoundStreamPro", "Engine")
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max(1, min(16, self.settings.value("max_concurrent", MAX_CONCURRENT_DOWNLOADS, type=int))))
+        self.analysis_pool = QThreadPool(self)
+        self.analysis_pool.setMaxThreadCount(MAX_CONCURRENT_ANALYSES)
         
         self._jobs: Dict[str, JobRecord] = {}
         self._jobs_lock = threading.Lock()
-        self._row_index: Dict[str, int] = {}
+        self._pending_progress: Dict[str, float] = {}
+        self._pending_status: Dict[str, str] = {}
         self._pending_retry_id: Optional[str] = None
+        self._job_counter = count(1)
         
         self._current_meta: Optional[EntityStub] = None
         self._temp_files: List[Path] = []
+        self._analysis_token = 0
+        self._closing = False
         self._analysis_cover_path: Optional[Path] = None
 
-        self.settings = QSettings("SoundStreamPro", "Engine")
-
         self.debounce_timer = QTimer(self)
         self.debounce_timer.setSingleShot(True)
         self.debounce_timer.setInterval(750)
         self.debounce_timer.timeout.connect(self._process_reactive_url)
+
+        self.table_flush_timer = QTimer(self)
+        self.table_flush_timer.setSingleShot(True)
+        self.table_flush_timer.setInterval(33)
+        self.table_flush_timer.timeout.connect(self._flush_job_updates)
         
-        self.qt_log_handler = QtLogHandler()
-        logging.getLogger().addHandler(self.qt_log_handler)
+        self._is_dark = True
+        if log_handler is None:
+            log_handler = QtLogHandler()
+            logging.getLogger().addHandler(log_handler)
+        self.qt_log_handler = log_handler
         
         self.init_ui()
         self._init_menu_bar()
@@ -1575,10 +1860,11 @@ class MainWindow(QMainWindow):
         self.path_input.setText(self.settings.value("output_path", str(DEFAULT_DOWNLOAD_DIR)))
         default_flags = '--extractor-args "youtube:player_client=android,tv" --match-filter "!is_live" --force-ipv4'
         self.inspector.in_custom_flags.setText(self.settings.value("custom_flags", default_flags))
-        self.inspector.in_output_tmpl.setText(self.settings.value("output_template", "%(title)s - %(artist)s.%(ext)s"))
+        self.inspector.in_output_tmpl.setText(self.settings.value("output_template", DEFAULT_OUTPUT_TEMPLATE))
 
     def _save_settings(self) -> None:
         self.settings.setValue("output_path", self.path_input.text())
+        self.settings.setValue("max_concurrent", self.spin_parallel.value())
         if not sip.isdeleted(self.inspector):
             self.settings.setValue("custom_flags", self.inspector.in_custom_flags.text())
             self.settings.setValue("output_template", self.inspector.in_output_tmpl.text())
@@ -1588,10 +1874,9 @@ class MainWindow(QMainWindow):
         with proc.SessionStateManager._cookie_lock:
             if not cookie_path.exists(): return True
             try:
-                with open(cookie_path, "r", encoding="utf-8", errors="ignore") as f:
-                    if "# Netscape HTTP Cookie File" not in f.read(100):
-                        QMessageBox.critical(self, "Erro de Integridade Léxica", "O ficheiro 'cookies.txt' não obedece ao padrão Netscape HTTP.")
-                        return False
+                if not proc.SessionStateManager.has_netscape_signature(cookie_path):
+                    QMessageBox.critical(self, "Erro de Integridade Léxica", "O ficheiro 'cookies.txt' não obedece ao padrão Netscape HTTP.")
+                    return False
             except Exception: pass
             return True
 
@@ -1643,7 +1928,8 @@ class MainWindow(QMainWindow):
         if app:
             app.setPalette(ThemeManager.get_palette(is_dark))
             app.setStyleSheet(ThemeManager.get_stylesheet(is_dark))
-        self.log_viewer.update_theme_colors(is_dark)
+        self._is_dark = is_dark
+        if self.log_viewer is not None: self.log_viewer.update_theme_colors(is_dark)
 
     def _show_about_dialog(self) -> None:
         QMessageBox.about(self, "Sobre", f"{APP_NAME} {VERSION}\n\nInterface construída via PyQt6 com arquitetura orientada a eventos.")
@@ -1698,27 +1984,40 @@ class MainWindow(QMainWindow):
         action_layout.addWidget(self.path_input)
         action_layout.addWidget(btn_path)
         action_layout.addStretch()
+        self.spin_parallel = QSpinBox(self.action_bar)
+        self.spin_parallel.setRange(1, 16)
+        self.spin_parallel.setValue(self.thread_pool.maxThreadCount())
+        self.spin_parallel.valueChanged.connect(self.thread_pool.setMaxThreadCount)
+        action_layout.addWidget(QLabel("Transferências Simultâneas:", self.action_bar))
+        action_layout.addWidget(self.spin_parallel)
         action_layout.addWidget(self.btn_queue)
         main_layout.addWidget(self.action_bar)
 
-        self.table = QTableWidget(top_container)
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Ficheiro / Título", "Formato", "Estado", "Progresso", "Ações"])
+        self.queue_model = DownloadQueueModel(self)
+        self.table = QTableView(top_container)
+        self.table.setModel(self.queue_model)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        if self.table.horizontalHeader():
-            self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-            self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setItemDelegateForColumn(DownloadQueueModel.COL_PROGRESS, ProgressBarDelegate(self.table))
+        self.action_delegate = ActionButtonDelegate(self.table)
+        self.action_delegate.clicked.connect(self._on_row_action)
+        self.table.setItemDelegateForColumn(DownloadQueueModel.COL_ACTION, self.action_delegate)
+        self.table.setSortingEnabled(False)
+        if header := self.table.horizontalHeader():
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            header.setSectionResizeMode(DownloadQueueModel.COL_TITLE, QHeaderView.ResizeMode.Stretch)
+            for col, width in _QUEUE_COLUMN_WIDTHS: self.table.setColumnWidth(col, width)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(30)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._show_context_menu)
         main_layout.addWidget(self.table)
         
-        self.log_viewer = LogViewerWidget(main_splitter)
-        self.log_viewer.setVisible(False)
-        self.qt_log_handler.log_record.connect(self.log_viewer.append_log)
+        self.log_viewer: Optional[LogViewerWidget] = None
+        self.main_splitter = main_splitter
         
         main_splitter.addWidget(top_container)
-        main_splitter.addWidget(self.log_viewer)
-        main_splitter.setSizes([800, 200])
         main_splitter.setCollapsible(0, False)
         
         final_layout = QVBoxLayout(central)
@@ -1727,12 +2026,11 @@ class MainWindow(QMainWindow):
 
     def _show_context_menu(self, pos: Any) -> None:
         menu = QMenu(self)
-        item = self.table.itemAt(pos)
+        index = self.table.indexAt(pos)
         
-        if item is not None:
-            row = item.row()
-            job_id = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-            status = self.table.item(row, 2).text()
+        if index.isValid():
+            job_id = self.queue_model.job_id_at(index.row())
+            status = self.queue_model.status_of(job_id)
             
             if "Concluído" in status:
                 menu.addAction("Editar Metadados Localmente", lambda: self._edit_local_metadata(job_id))
@@ -1769,9 +2067,7 @@ class MainWindow(QMainWindow):
                 state.custom_filename = dialog.new_filepath.stem
                 state.resolved_output_path = str(dialog.new_filepath)
                 record.config = replace(config, meta_title=dialog.in_title.text(), meta_artist=dialog.in_artist.text(), meta_album=dialog.in_album.text())
-            row = self.get_row_by_id(job_id)
-            if row >= 0:
-                self.table.item(row, 0).setText(dialog.new_filepath.name)
+            self.queue_model.set_title(job_id, dialog.new_filepath.name)
 
     def _remove_from_queue(self, job_id: str) -> None:
         with self._jobs_lock:
@@ -1781,22 +2077,26 @@ class MainWindow(QMainWindow):
                     record.runnable.cancel()
                 record.is_terminal = True
             
-        row = self._row_index.pop(job_id, -1)
-        if row >= 0:
-            self.table.removeRow(row)
-            for jid in list(self._row_index.keys()):
-                if self._row_index[jid] > row: self._row_index[jid] -= 1
+        self._discard_pending_updates(job_id)
+        self.queue_model.remove_job(job_id)
 
     def _clear_finished_jobs(self) -> None:
-        to_remove = []
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 2) and self.table.item(row, 2).text() in ["✔ Concluído", "✘ Erro", "Cancelado"]:
-                to_remove.append(self.table.item(row, 0).data(Qt.ItemDataRole.UserRole))
-        for jid in reversed(to_remove):
+        for jid in reversed(self.queue_model.job_ids_with_status(_TERMINAL_STATUSES)):
             self._remove_from_queue(jid)
 
+    def _ensure_log_viewer(self) -> LogViewerWidget:
+        if self.log_viewer is None:
+            self.log_viewer = LogViewerWidget(self.main_splitter)
+            self.log_viewer.update_theme_colors(self._is_dark)
+            self.log_viewer.attach_source(self.qt_log_handler.drain)
+            self.qt_log_handler.log_pending.connect(self.log_viewer.schedule_flush)
+            self.main_splitter.addWidget(self.log_viewer)
+            self.main_splitter.setSizes([800, 200])
+        return self.log_viewer
+
     def toggle_dev_mode(self, checked: bool) -> None:
-        self.log_viewer.setVisible(checked)
+        if checked: self._ensure_log_viewer().setVisible(True)
+        elif self.log_viewer is not None: self.log_viewer.setVisible(False)
         logging.getLogger().setLevel(logging.DEBUG if checked else logging.INFO)
 
     def start_analysis(self) -> None:
@@ -1807,13 +2107,19 @@ class MainWindow(QMainWindow):
         self.btn_analyze.setEnabled(False)
         self.btn_analyze.setText("A processar...")
         
-        worker = proc.AnalysisWorker(url)
+        self._analysis_token += 1
+        worker = proc.AnalysisWorker(url, self._analysis_token)
         worker.signals.result.connect(self.on_analysis_success)
-        worker.signals.thumbnail_data.connect(self.on_thumbnail_ready)
+        worker.signals.thumbnail_image.connect(self.on_thumbnail_ready)
         worker.signals.error.connect(self.on_analysis_error)
-        worker.signals.finished.connect(lambda: self.btn_analyze.setEnabled(True) if not sip.isdeleted(self.btn_analyze) else None)
-        worker.signals.finished.connect(lambda: self.btn_analyze.setText("Analisar Multimédia") if not sip.isdeleted(self.btn_analyze) else None)
-        self.thread_pool.start(worker)
+        worker.signals.finished.connect(self._on_analysis_finished)
+        self.analysis_pool.start(worker)
+
+    @pyqtSlot()
+    def _on_analysis_finished(self) -> None:
+        if sip.isdeleted(self.btn_analyze): return
+        self.btn_analyze.setEnabled(True)
+        self.btn_analyze.setText("Analisar Multimédia")
 
     @pyqtSlot(object)
     def on_analysis_success(self, meta: Any) -> None:
@@ -1835,25 +2141,20 @@ class MainWindow(QMainWindow):
         self.inspector.setVisible(True)
         self.action_bar.setVisible(True)
 
-    @pyqtSlot(bytes)
-    def on_thumbnail_ready(self, data: bytes) -> None:
-        if sip.isdeleted(self.inspector): return
+    @pyqtSlot(QImage, str, int)
+    def on_thumbnail_ready(self, image: QImage, cover_path: str, token: int) -> None:
+        if self._closing or token != self._analysis_token or sip.isdeleted(self.inspector):
+            if cover_path: Path(cover_path).unlink(missing_ok=True)
+            return
         
         if self._analysis_cover_path and self._analysis_cover_path.exists():
             self._analysis_cover_path.unlink(missing_ok=True)
             
-        if shutil.disk_usage(tempfile.gettempdir()).free < 5_000_000:
-            logging.warning("[I/O] Espaço em disco insuficiente para cache de miniaturas.")
-            return
-
-        tmp = Path(tempfile.NamedTemporaryFile(delete=False, suffix=".jpg", prefix="cover_sndstream_").name)
-        pixmap = QPixmap()
-        if pixmap.loadFromData(data):
-            pixmap.toImage().convertToFormat(QImage.Format.Format_RGB32).save(str(tmp), "JPG", 95)
-            self._analysis_cover_path = tmp
-            self._temp_files.append(tmp)
-            if not self.inspector._local_custom_cover_path:
-                self.inspector.set_thumbnail(pixmap)
+        if cover_path:
+            self._analysis_cover_path = Path(cover_path)
+            self._temp_files.append(self._analysis_cover_path)
+        if not self.inspector._local_custom_cover_path:
+            self.inspector.set_thumbnail(QPixmap.fromImage(image))
 
     @pyqtSlot(str)
     def on_analysis_error(self, err_msg: str) -> None:
@@ -1873,7 +2174,7 @@ class MainWindow(QMainWindow):
             with self._jobs_lock:
                 record = self._jobs.get(self._pending_retry_id)
                 config, state = record.config, record.state
-            self._spawn_download(config, state, is_retry=False)
+            self._spawn_downloads([(config, state)])
             self._reset_ui_state()
             self.url_input.clear()
             return
@@ -1882,15 +2183,20 @@ class MainWindow(QMainWindow):
         data = self.inspector.get_config_delta()
         
         is_playlist = getattr(self._current_meta, 'is_playlist', False)
+        output_path = Path(self.path_input.text())
+        source_url = getattr(self.inspector, '_current_source_url', '').lower()
+        source_is_audio = any(x in source_url for x in _AUDIO_SOURCE_MARKERS)
+        tmpl = data.get('output_template', '') or _DEFAULT_FILENAME_TMPL
+        job_kwargs = {k: data[k] for k in _JOB_CONFIG_KEYS if k in data}
+        batch: List[Tuple[proc.DownloadJobConfig, proc.DownloadJobState]] = []
         for entity in (self._current_meta.children if is_playlist else [self._current_meta]):
-            job_id = str(uuid.uuid4())
+            job_id = self._next_job_id()
             target_url = UrlResolver.resolve_download_url(entity, getattr(entity, 'original_id', ''))
-            source_url = getattr(self.inspector, '_current_source_url', '')
             
-            is_audio_centric = getattr(entity, 'is_search_query', False) or any(x in str(target_url).lower() for x in ['ytmsearch', 'ytsearch', 'music.youtube', 'soundcloud']) or any(x in source_url.lower() for x in ['spotify', 'music.youtube', 'soundcloud'])
+            is_audio_centric = source_is_audio or getattr(entity, 'is_search_query', False) or any(x in str(target_url).lower() for x in _AUDIO_TARGET_MARKERS)
             if is_audio_centric:
                 data['media_type'] = proc.MediaType.AUDIO
-                if data['format_container'] in ['mp4', 'mkv', 'webm', 'avi']: data['format_container'] = 'mp3'
+                if data['format_container'] in _VIDEO_CONTAINER_SET: data['format_container'] = 'mp3'
             
             final_title = data.get('meta_title', '').strip() if (not is_playlist and data.get('meta_title')) else getattr(entity, 'title', '')
             final_artist = data.get('meta_artist', '').strip() if (not is_playlist and data.get('meta_artist')) else getattr(entity, 'artist', '')
@@ -1902,7 +2208,6 @@ class MainWindow(QMainWindow):
             resolved_filename = data.get('custom_filename', '').strip()
             
             if is_playlist or not resolved_filename:
-                tmpl = data.get('output_template', '') or "%(title)s - %(artist)s"
                 mapping = {
                     'title': final_title,
                     'artist': final_artist,
@@ -1913,13 +2218,7 @@ class MainWindow(QMainWindow):
                     'upload_date': final_date[:4] if final_date else "",
                     'ext': data['format_container']
                 }
-                def safe_sub(match: re.Match) -> str:
-                    key = match.group(1)
-                    val = mapping.get(key, f"%({key})s")
-                    return _UNSAFE_CHARS.sub('', str(val))
-                    
-                res = _TMPL_PATTERN.sub(safe_sub, tmpl)
-                resolved_filename = _WHITESPACE.sub(' ', res).strip(' -_')
+                resolved_filename = _render_template(tmpl, mapping)
 
             ext = data['format_container']
             if resolved_filename.lower().endswith(f".{ext.lower()}"):
@@ -1929,19 +2228,12 @@ class MainWindow(QMainWindow):
                 resolved_filename = "output_stream"
                 
             config = proc.DownloadJobConfig(
-                job_id=job_id, url=target_url, output_path=Path(self.path_input.text()),
+                job_id=job_id, url=target_url, output_path=output_path,
                 media_type=data['media_type'], format_container=data['format_container'],
-                audio_codec=data['audio_codec'], video_codec=data['video_codec'],
-                quality_preset=data['quality_preset'], audio_sample_rate=data['audio_sample_rate'],
-                audio_bitrate=str(data['audio_bitrate']), audio_bit_depth=data['audio_bit_depth'],
-                output_template=data['output_template'], ffmpeg_path=data['ffmpeg_path'],
-                custom_flags=data['custom_flags'], meta_title=final_title,
-                meta_artist=final_artist, meta_album=final_album,
+                meta_title=final_title, meta_artist=final_artist, meta_album=final_album,
                 meta_genre=final_genre, meta_date=final_date, meta_desc=final_desc,
-                embed_metadata=data['embed_meta'], embed_thumbnail=data['embed_thumb'],
-                embed_subs=data['embed_subs'], normalize_audio=data['norm_audio'],
-                use_browser_cookies=data['use_cookies'], spotify_thumb_url=getattr(entity, 'thumbnail_url', None),
-                duration=getattr(entity, 'duration', 0.0)
+                spotify_thumb_url=getattr(entity, 'thumbnail_url', None),
+                duration=getattr(entity, 'duration', 0.0), **job_kwargs
             )
             
             state = proc.DownloadJobState(
@@ -1951,8 +2243,9 @@ class MainWindow(QMainWindow):
             
             with self._jobs_lock:
                 self._jobs[job_id] = JobRecord(config=config, state=state)
-            self._spawn_download(config, state, False)
+            batch.append((config, state))
             
+        self._spawn_downloads(batch)
         self._reset_ui_state()
         self.url_input.clear()
 
@@ -1965,7 +2258,7 @@ class MainWindow(QMainWindow):
             
         self._remove_from_queue(job_id)
         
-        new_id = str(uuid.uuid4())
+        new_id = self._next_job_id()
         new_config = replace(config, job_id=new_id)
         
         with self._jobs_lock:
@@ -1978,73 +2271,87 @@ class MainWindow(QMainWindow):
         self.btn_queue.setText("Confirmar Retentativa")
         self._pending_retry_id = new_id
 
-    def _spawn_download(self, config: proc.DownloadJobConfig, state: proc.DownloadJobState, is_retry: bool) -> None:
+    def _spawn_downloads(self, jobs: List[Tuple[proc.DownloadJobConfig, proc.DownloadJobState]]) -> None:
+        rows = []
+        for config, state in jobs:
+            fmt_display = config.format_container.upper()
+            if config.media_type == proc.MediaType.VIDEO: fmt_display += f" ({config.quality_preset})"
+            rows.append((config.job_id, f"{state.custom_filename}.{config.format_container}", fmt_display))
+        self.queue_model.add_jobs(rows)
+        for config, state in jobs: self._spawn_download(config, state)
+
+    def _spawn_download(self, config: proc.DownloadJobConfig, state: proc.DownloadJobState) -> None:
         runnable = proc.DownloadWorker(config)
         runnable.state = state
-        runnable.signals.progress.connect(self.update_progress)
-        runnable.signals.status.connect(self.update_status)
-        runnable.signals.finished.connect(lambda: self.on_job_finished(config.job_id))
-        runnable.signals.error.connect(lambda err: self.on_job_error(config.job_id, err))
+        queued = Qt.ConnectionType.QueuedConnection
+        runnable.signals.progress.connect(self.update_progress, queued)
+        runnable.signals.status.connect(self.update_status, queued)
+        runnable.signals.job_finished.connect(self.on_job_finished, queued)
+        runnable.signals.job_error.connect(self.on_job_error, queued)
         
         with self._jobs_lock:
             if config.job_id in self._jobs:
                 self._jobs[config.job_id].runnable = runnable
             
-        if not is_retry:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self._row_index[config.job_id] = row
-            
-            display = f"{state.custom_filename}.{config.format_container}"
-            self.table.setItem(row, 0, QTableWidgetItem(display))
-            self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, config.job_id)
-            
-            fmt_display = config.format_container.upper()
-            if config.media_type == proc.MediaType.VIDEO: fmt_display += f" ({config.quality_preset})"
-            self.table.setItem(row, 1, QTableWidgetItem(fmt_display))
-            self.table.setItem(row, 2, QTableWidgetItem("Na Fila"))
-            
-            pbar = QProgressBar()
-            pbar.setValue(0)
-            self.table.setCellWidget(row, 3, pbar)
-            
-            btn_cancel = QPushButton("Parar")
-            btn_cancel.setObjectName("Destructive")
-            btn_cancel.clicked.connect(lambda _, jid=config.job_id: self.cancel_job(jid))
-            
-            container = QWidget()
-            layout = QHBoxLayout(container)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.addWidget(btn_cancel)
-            self.table.setCellWidget(row, 4, container)
-            
         self.thread_pool.start(runnable)
 
-    def get_row_by_id(self, job_id: str) -> int:
-        return self._row_index.get(job_id, -1)
+    def _next_job_id(self) -> str:
+        return f"{next(self._job_counter):05d}-{_SESSION_TAG}"
+
+    @pyqtSlot(str, str)
+    def _on_row_action(self, job_id: str, action: str) -> None:
+        if action == "Parar": self.cancel_job(job_id)
+        elif action == "Abrir Pasta": self.open_output_folder()
+        elif action == "Repetir": self.retry_job(job_id)
 
     @pyqtSlot(str, float, str)
     def update_progress(self, job_id: str, pct: float, speed: str) -> None:
-        if (row := self.get_row_by_id(job_id)) >= 0:
-            if isinstance(w := self.table.cellWidget(row, 3), QProgressBar): w.setValue(int(pct))
-            if i := self.table.item(row, 2): i.setText(f"▼ {speed}")
+        if not self._is_job_live(job_id): return
+        self._pending_progress[job_id] = pct
+        self._pending_status[job_id] = _DOWN_PREFIX + speed
+        if not self.table_flush_timer.isActive(): self.table_flush_timer.start()
 
     @pyqtSlot(str, str)
     def update_status(self, job_id: str, msg: str) -> None:
-        if (row := self.get_row_by_id(job_id)) >= 0:
-            if i := self.table.item(row, 2): i.setText(msg)
+        if not self._is_job_live(job_id): return
+        self._pending_status[job_id] = msg
+        if not self.table_flush_timer.isActive(): self.table_flush_timer.start()
 
-    def on_job_finished(self, job_id: str) -> None:
+    def _is_job_live(self, job_id: str) -> bool:
         with self._jobs_lock:
             record = self._jobs.get(job_id)
-            if not record or record.is_terminal: return
-        self._cleanup_job(job_id, "✔ Concluído", QColor("#4caf50"))
+            return record is not None and not record.is_terminal
 
+    @pyqtSlot()
+    def _flush_job_updates(self) -> None:
+        progress, self._pending_progress = self._pending_progress, {}
+        status, self._pending_status = self._pending_status, {}
+        for job_id, pct in progress.items():
+            if self._is_job_live(job_id): self.queue_model.set_progress(job_id, pct)
+        for job_id, msg in status.items():
+            if self._is_job_live(job_id): self.queue_model.set_status(job_id, msg)
+
+    def _discard_pending_updates(self, job_id: str) -> None:
+        self._pending_progress.pop(job_id, None)
+        self._pending_status.pop(job_id, None)
+
+    @pyqtSlot(str, bool)
+    def on_job_finished(self, job_id: str, aborted: bool) -> None:
+        with self._jobs_lock:
+            record = self._jobs.get(job_id)
+            if not record: return
+            record.runnable = None
+            was_terminal, cancelled = record.is_terminal, record.cancelled
+            record.is_terminal = True
+        if aborted: self._cleanup_job(job_id, "Cancelado", _STATUS_CANCELLING_COLOR)
+        elif cancelled or not was_terminal: self._cleanup_job(job_id, "✔ Concluído", _STATUS_DONE_COLOR)
+
+    @pyqtSlot(str, str)
     def on_job_error(self, job_id: str, err: str) -> None:
         with self._jobs_lock:
             record = self._jobs.get(job_id)
-            if record: record.is_terminal = True
-        self._cleanup_job(job_id, "✘ Erro", QColor("#d32f2f"))
+            if record: record.is_terminal, record.cancelled = True, False
+        self._cleanup_job(job_id, "✘ Erro", _STATUS_ERROR_COLOR)
         
         if "NetworkBlockedCDNError" in err or "timeout" in err.lower():
             mitigation_html = (
@@ -2064,38 +2371,21 @@ class MainWindow(QMainWindow):
     def cancel_job(self, job_id: str) -> None:
         with self._jobs_lock:
             record = self._jobs.get(job_id)
-            if record and record.runnable:
-                record.runnable.cancel()
-                record.is_terminal = True
-        if (row := self.get_row_by_id(job_id)) >= 0:
-            if i := self.table.item(row, 2):
-                i.setText("A Cancelar...")
-                i.setForeground(QColor("#ff9800"))
+            if not record or not record.runnable or record.is_terminal: return
+            record.runnable.cancel()
+            record.is_terminal = record.cancelled = True
+            never_started = self.thread_pool.tryTake(record.runnable)
+            if never_started: record.runnable = None
+        self._discard_pending_updates(job_id)
+        self.queue_model.set_status(job_id, "A Cancelar...", _STATUS_CANCELLING_COLOR)
+        if never_started: self.on_job_finished(job_id, True)
 
     def _cleanup_job(self, job_id: str, status_text: str, color: QColor) -> None:
-        row = self.get_row_by_id(job_id)
-        if row >= 0:
-            if i := self.table.item(row, 2):
-                i.setText(status_text)
-                i.setForeground(color)
-            
-            if "Concluído" in status_text:
-                if isinstance(w := self.table.cellWidget(row, 3), QProgressBar): w.setValue(100)
-                btn = QPushButton("Abrir Pasta")
-                btn.clicked.connect(self.open_output_folder)
-            else:
-                if isinstance(w := self.table.cellWidget(row, 3), QProgressBar): w.setValue(0)
-                btn = QPushButton("Repetir")
-                btn.setObjectName("PrimaryAction")
-                btn.clicked.connect(lambda _, jid=job_id: self.retry_job(jid))
-                
-            container = QWidget()
-            layout = QHBoxLayout(container)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.addWidget(btn)
-            self.table.setCellWidget(row, 4, container)
-            
-        QTimer.singleShot(2500, lambda: self._jobs.get(job_id) and setattr(self._jobs[job_id], 'runnable', None))
+        self._discard_pending_updates(job_id)
+        done = "Concluído" in status_text
+        self.queue_model.set_status(job_id, status_text, color)
+        self.queue_model.set_progress(job_id, 100 if done else 0)
+        self.queue_model.set_action(job_id, "Abrir Pasta" if done else "Repetir")
 
     def closeEvent(self, event: QCloseEvent) -> None:
         self._save_settings()
@@ -2105,8 +2395,15 @@ class MainWindow(QMainWindow):
                 if record.runnable:
                     record.runnable.cancel()
                 
-        if not self.thread_pool.waitForDone(3000):
+        self.thread_pool.clear()
+        self.analysis_pool.clear()
+        if not self.thread_pool.waitForDone(3000) or not self.analysis_pool.waitForDone(1000):
             logging.warning("[UI] Timeout no encerramento das threads. Forçando destruição.")
+
+        self._closing = True
+        proc.AnalysisWorker.close_thumbnail_io()
+        proc.YtDlpAdapter.close_probes()
+        QCoreApplication.sendPostedEvents(self, QEvent.Type.MetaCall.value)
             
         for f in self._temp_files:
             try: f.unlink(missing_ok=True)
@@ -2122,14 +2419,28 @@ class MainWindow(QMainWindow):
 def handle_exception(exc_type: type[BaseException], exc_value: BaseException, exc_traceback: Optional[types.TracebackType]) -> None:
     logging.critical("Exceção não tratada:", exc_info=(exc_type, exc_value, exc_traceback))
 
+def setup_logging(*handlers: logging.Handler) -> QueueListener:
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(), *handlers, respect_handler_level=True)
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    listener.start()
+    return listener
+
 def main() -> None:
     sys.excepthook = handle_exception
-    logging.basicConfig(level=logging.INFO)
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion") 
-    win = MainWindow()
-    win.show()
-    sys.exit(app.exec())
+    qt_log_handler = QtLogHandler()
+    log_listener = setup_logging(qt_log_handler)
+    try:
+        if not proc.resolve_ffmpeg_binary():
+            logging.warning("[Dependência] Binário 'ffmpeg' não encontrado no PATH. O pós-processamento DSP irá falhar.")
+        app = QApplication(sys.argv)
+        app.setStyle("Fusion") 
+        win = MainWindow(qt_log_handler)
+        win.show()
+        exit_code = app.exec()
+    finally:
+        log_listener.stop()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
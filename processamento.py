@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import collections
 import dataclasses
+import errno
 import json
 import logging
 import os
@@ -9,45 +10,114 @@ import random
 import re
 import shlex
 import shutil
-import ssl
 import subprocess
 import tempfile
 import threading
 import time
-import urllib.request
 import uuid
 import importlib.util
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     Any, Callable, Dict, Iterator, List, Optional, 
-    Sequence, TypeVar, ClassVar, Final, cast
+    TypeVar, Final, cast, TYPE_CHECKING
 )
 
-from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot, QBuffer, QByteArray, QIODevice, QSize, Qt
+from PyQt6.QtGui import QImage, QImageReader
 
 # ============================================================================
 # BOOTSTRAP & DEPENDÊNCIAS EXTERNAS
 # ============================================================================
-try:
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
     import yt_dlp
-    from yt_dlp.utils import DownloadError
+    from yt_dlp.utils import DownloadError, match_filter_func
     from yt_dlp.networking.impersonate import ImpersonateTarget
-except ImportError as exc:
-    raise ImportError(f"CRITICAL: Dependência yt-dlp não resolvida. {exc}") from exc
+else:
+    yt_dlp = DownloadError = match_filter_func = ImpersonateTarget = None
+
+_HAS_YTDLP: Final[bool] = importlib.util.find_spec("yt_dlp") is not None
+if not _HAS_YTDLP:
+    _LOGGER.critical("[Dependência] 'yt-dlp' ausente. Extração e transferências indisponíveis.")
+_ytdlp_import_lock = threading.Lock()
+
+def _ensure_ytdlp() -> None:
+    global yt_dlp, DownloadError, match_filter_func, ImpersonateTarget
+    if yt_dlp is not None: return
+    with _ytdlp_import_lock:
+        if yt_dlp is not None: return
+        try:
+            import yt_dlp as _yt_dlp
+            from yt_dlp.utils import DownloadError as _DownloadError, match_filter_func as _match_filter_func
+            from yt_dlp.networking.impersonate import ImpersonateTarget as _ImpersonateTarget
+        except ImportError as exc:
+            raise MediaSystemError(f"CRITICAL: Dependência yt-dlp não resolvida. {exc}") from exc
+        DownloadError, match_filter_func, ImpersonateTarget = _DownloadError, _match_filter_func, _ImpersonateTarget
+        yt_dlp = _yt_dlp
+
+SUBPROCESS_FLAGS: Final[int] = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
 
 _HAS_CURL_CFFI: Final[bool] = importlib.util.find_spec("curl_cffi") is not None
 if not _HAS_CURL_CFFI:
-    logging.getLogger(__name__).warning("[Dependência] 'curl_cffi' ausente. TLS Impersonation inativo.")
-
-try:
-    import spotipy  # type: ignore
-    from spotipy.oauth2 import SpotifyClientCredentials  # type: ignore
-except ImportError as exc:
-    raise ImportError(f"CRITICAL: Dependência spotipy não resolvida. {exc}") from exc
+    _LOGGER.warning("[Dependência] 'curl_cffi' ausente. TLS Impersonation inativo.")
+
+if TYPE_CHECKING:
+    import spotipy
+    from spotipy.oauth2 import SpotifyClientCredentials
+else:
+    spotipy = SpotifyClientCredentials = None
+
+_HAS_SPOTIPY: Final[bool] = importlib.util.find_spec("spotipy") is not None
+if not _HAS_SPOTIPY:
+    _LOGGER.warning("[Dependência] 'spotipy' ausente. Resolução de URLs Spotify indisponível.")
+_spotipy_import_lock = threading.Lock()
+
+def _ensure_spotipy() -> None:
+    global spotipy, SpotifyClientCredentials
+    if spotipy is not None: return
+    with _spotipy_import_lock:
+        if spotipy is not None: return
+        try:
+            import spotipy as _spotipy  # type: ignore
+            from spotipy.oauth2 import SpotifyClientCredentials as _SpotifyClientCredentials  # type: ignore
+        except ImportError as exc:
+            raise MediaSystemError(f"CRITICAL: Dependência spotipy não resolvida. {exc}") from exc
+        SpotifyClientCredentials = _SpotifyClientCredentials
+        spotipy = _spotipy
+
+if TYPE_CHECKING:
+    import requests
+
+_HAS_REQUESTS: Final[bool] = importlib.util.find_spec("requests") is not None
+if not _HAS_REQUESTS:
+    _LOGGER.warning("[Dependência] 'requests' ausente. Transferência de miniaturas indisponível.")
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+def _get_http_session() -> requests.Session:
+    global _http_session
+    if _http_session is not None: return _http_session
+    with _http_session_lock:
+        if _http_session is not None: return _http_session
+        try:
+            import requests as _requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+        except ImportError as exc:
+            raise MediaSystemError(f"CRITICAL: Dependência requests não resolvida. {exc}") from exc
+        session = _requests.Session()
+        session.headers['User-Agent'] = 'Mozilla/5.0'
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.3)))
+        _http_session = session
+        return session
 
 # ============================================================================
 # CAMADA DE DOMÍNIO (DOMAIN LAYER)
@@ -71,10 +141,21 @@ class AppConfig:
     max_retries: int = 3
     base_backoff_delay: float = 2.0
     max_backoff_delay: float = 30.0
+    concurrent_fragments: int = 4
 
 _APP_CONFIG: Final[AppConfig] = AppConfig()
-
-@dataclass(frozen=True)
+_IO_POOL: Final[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=4, thread_name_prefix="thumb_io")
+_LOSSLESS_CONTAINERS: Final[frozenset[str]] = frozenset({'flac', 'wav'})
+_LOSSY_CONTAINERS: Final[frozenset[str]] = frozenset({'mp3', 'm4a', 'aac'})
+_AAC_CONTAINERS: Final[frozenset[str]] = frozenset({'m4a', 'aac'})
+_PARTIAL_SUFFIXES: Final[tuple[str, ...]] = ('.part', '.ytdl')
+_AUTH_ERROR_MARKERS: Final[tuple[str, ...]] = ("sign in", "members only", "private", "age")
+_SEARCH_STRIP: Final[re.Pattern[str]] = re.compile(r'[^\w\s-]')
+_SPOTIFY_ID_PATTERNS: Final[Dict[str, re.Pattern[str]]] = {
+    kind: re.compile(fr"/{kind}/([a-zA-Z0-9]+)") for kind in ("track", "playlist", "album")
+}
+
+@dataclass(frozen=True, slots=True)
 class NormalizedMediaEntity:
     original_id: str
     title: str
@@ -107,10 +188,20 @@ class NormalizedMediaEntity:
     @property
     def ytm_search_query(self) -> str:
         query = f"{self.title} {self.artist}".strip()
-        query = re.sub(r'[^\w\s-]', '', query)
+        query = _SEARCH_STRIP.sub('', query)
         return f"ytmsearch1:{query}"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class MetadataCandidate:
+    title: str
+    artist: str
+    album: str
+    date: str
+    genre: str
+    release_id: str = ""
+    release_group_id: str = ""
+
+@dataclass(frozen=True, slots=True)
 class DownloadJobConfig:
     job_id: str
     url: str
@@ -140,7 +231,7 @@ class DownloadJobConfig:
     spotify_thumb_url: Optional[str] = None
     duration: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class DownloadJobState:
     custom_filename: str = ""
     custom_cover_path: Optional[str] = None
@@ -151,8 +242,8 @@ class DownloadJobState:
 # CROSS-CUTTING CONCERNS (LOGGING, UTILS, RESILIÊNCIA)
 # ============================================================================
 class StructuredLogger:
-    def __init__(self, name: str, context_id: str):
-        self._logger = logging.getLogger(name)
+    def __init__(self, logger: logging.Logger, context_id: str):
+        self._logger = logger
         self._context_id = context_id
 
     def _format(self, msg: str, **kwargs: Any) -> str:
@@ -172,6 +263,7 @@ T = TypeVar('T')
 
 def exponential_backoff(retries: int = 3, base_delay: float = 2.0, max_delay: float = 30.0) -> Callable:
     _RETRYABLE_PATTERNS = frozenset({"waf", "reload", "429", "rate limit", "timeout", "connection", "temporarily"})
+    backoff_logger = logging.getLogger("NetworkBackoff")
     
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
@@ -190,7 +282,7 @@ def exponential_backoff(retries: int = 3, base_delay: float = 2.0, max_delay: fl
                     last_exc = exc
                     delay = min(max_delay, random.uniform(base_delay, sleep_prev * 3))
                     sleep_prev = delay
-                    logging.getLogger("NetworkBackoff").warning(f"Retentativa {attempt+1}/{retries} em {delay:.2f}s. Erro: {exc}")
+                    backoff_logger.warning("Retentativa %d/%d em %.2fs. Erro: %s", attempt + 1, retries, delay, exc)
                     time.sleep(delay)
             raise NetworkError(f"Exaustão de retentativas ({retries}).") from last_exc
         return wrapper
@@ -234,9 +326,25 @@ class CircuitBreaker:
                 self._failure_count = 0
         return result
 
+_NETSCAPE_SIGNATURE: Final[str] = "# Netscape HTTP Cookie File"
+
+@lru_cache(maxsize=8)
+def _read_cookie_signature(path: str, mtime_ns: int, size: int) -> bool:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return _NETSCAPE_SIGNATURE in f.read(120)
+
 class SessionStateManager:
     _cookie_lock = threading.RLock()
 
+    @staticmethod
+    def has_netscape_signature(path: Path) -> bool:
+        st = path.stat()
+        return _read_cookie_signature(str(path.absolute()), st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def invalidate_signature_cache() -> None:
+        _read_cookie_signature.cache_clear()
+
     @staticmethod
     def create_ephemeral_cookie_jar() -> Optional[str]:
         central_cookie = Path("cookies.txt")
@@ -249,7 +357,7 @@ class SessionStateManager:
                     shutil.copyfileobj(src, dst)
                 return temp_path
             except Exception as e:
-                logging.getLogger(__name__).error(f"[I/O] Falha na alocação de sandbox de cookies: {e}")
+                _LOGGER.error("[I/O] Falha na alocação de sandbox de cookies: %s", e)
                 return None
 
     @staticmethod
@@ -271,7 +379,7 @@ class AudioProcessorPort(ABC):
 
 class IMessageBroker(ABC):
     @abstractmethod
-    def emit_finished(self) -> None: pass
+    def emit_finished(self, aborted: bool = False) -> None: pass
     @abstractmethod
     def emit_error(self, message: str) -> None: pass
     @abstractmethod
@@ -283,21 +391,25 @@ class IMessageBroker(ABC):
 
 class IMediaBroker(IMessageBroker):
     @abstractmethod
-    def emit_thumbnail(self, data: bytes) -> None: pass
+    def emit_thumbnail(self, image: QImage, cover_path: str, token: int) -> None: pass
 
 class SpotifyAdapter(MediaExtractorPort):
+    _logger: Final[logging.Logger] = logging.getLogger("SpotifyAdapter")
+
     def __init__(self) -> None:
-        self._logger = logging.getLogger(self.__class__.__name__)
         self.client: Optional[spotipy.Spotify] = None
         client_id, client_secret = os.environ.get("SPOTIPY_CLIENT_ID"), os.environ.get("SPOTIPY_CLIENT_SECRET")
-        if client_id and client_secret:
-            self.client = spotipy.Spotify(auth_manager=SpotifyClientCredentials(client_id=client_id, client_secret=client_secret))
+        self._credentials = (client_id, client_secret) if client_id and client_secret else None
 
     def is_spotify_url(self, url: str) -> bool:
         return "open.spotify.com" in url
 
     def resolve(self, url: str) -> NormalizedMediaEntity:
-        if not self.client: raise ExtractionError("Motor Spotify inoperante: Credenciais ausentes.")
+        if not self._credentials: raise ExtractionError("Motor Spotify inoperante: Credenciais ausentes.")
+        if self.client is None:
+            _ensure_spotipy()
+            client_id, client_secret = self._credentials
+            self.client = spotipy.Spotify(auth_manager=SpotifyClientCredentials(client_id=client_id, client_secret=client_secret))
         try:
             if "playlist" in url: return self._resolve_playlist(url)
             elif "track" in url: return self._resolve_track(url)
@@ -361,32 +473,82 @@ class SpotifyAdapter(MediaExtractorPort):
 
     @staticmethod
     def _extract_id(url: str, entity_type: str) -> str:
-        match = re.search(fr"/{entity_type}/([a-zA-Z0-9]+)", url)
+        pattern = _SPOTIFY_ID_PATTERNS.get(entity_type) or re.compile(fr"/{entity_type}/([a-zA-Z0-9]+)")
+        match = pattern.search(url)
         if not match: raise ValueError(f"Falha léxica ao extrair hash de {entity_type}.")
         return match.group(1)
 
 class YtDlpAdapter(MediaExtractorPort):
-    _network_semaphore = threading.BoundedSemaphore(value=5)
+    _network_semaphore = threading.BoundedSemaphore(value=16)
     _circuit_breaker: CircuitBreaker = CircuitBreaker(_APP_CONFIG.failure_threshold_cb, _APP_CONFIG.recovery_timeout_cb)
+    _RESOLVE_TTL: Final[float] = 600.0
+    _RESOLVE_CACHE_SIZE: Final[int] = 32
+    _resolve_cache: collections.OrderedDict[str, tuple[float, NormalizedMediaEntity]] = collections.OrderedDict()
+    _resolve_cache_lock = threading.Lock()
+    _PROBE_POOL_SIZE: Final[int] = 4
+    _probe_idle: List[yt_dlp.YoutubeDL] = []
+    _probe_lock = threading.Lock()
 
-    @exponential_backoff(retries=3)
     def resolve(self, url: str) -> NormalizedMediaEntity:
+        now = time.monotonic()
+        with self._resolve_cache_lock:
+            hit = self._resolve_cache.get(url)
+            if hit and now - hit[0] < self._RESOLVE_TTL:
+                self._resolve_cache.move_to_end(url)
+                return hit[1]
+
+        _ensure_ytdlp()
+        entity = self._resolve_remote(url)
+        with self._resolve_cache_lock:
+            self._resolve_cache[url] = (now, entity)
+            self._resolve_cache.move_to_end(url)
+            while len(self._resolve_cache) > self._RESOLVE_CACHE_SIZE:
+                self._resolve_cache.popitem(last=False)
+        return entity
+
+    @classmethod
+    def _probe_opts(cls) -> Dict[str, Any]:
         opts = {
             'quiet': True, 'no_warnings': True, 'extract_flat': 'in_playlist',
             'socket_timeout': _APP_CONFIG.network_timeout, 'source_address': '0.0.0.0',
             'logger': logging.getLogger('yt_dlp_adapter'), 'javascript_executor': 'deno', 'cachedir': False
         }
-        target = self._get_tls_target()
+        target = cls._get_tls_target()
         if target: opts['impersonate'] = target
+        return opts
+
+    @classmethod
+    @contextmanager
+    def _probe_ydl(cls) -> Iterator[yt_dlp.YoutubeDL]:
+        # YoutubeDL is not thread-safe: each probe checks an instance out exclusively and returns it to a bounded idle pool.
+        with cls._probe_lock:
+            ydl = cls._probe_idle.pop() if cls._probe_idle else None
+        if ydl is None: ydl = yt_dlp.YoutubeDL(cls._probe_opts())
+        try:
+            yield ydl
+        finally:
+            with cls._probe_lock:
+                if len(cls._probe_idle) < cls._PROBE_POOL_SIZE:
+                    cls._probe_idle.append(ydl)
+                    ydl = None
+            if ydl is not None: ydl.close()
+
+    @classmethod
+    def close_probes(cls) -> None:
+        with cls._probe_lock:
+            idle, cls._probe_idle = cls._probe_idle, []
+        for ydl in idle: ydl.close()
 
+    @exponential_backoff(retries=3)
+    def _resolve_remote(self, url: str) -> NormalizedMediaEntity:
         def _extract() -> Dict[str, Any]:
             with self._network_semaphore:
                 try:
-                    with yt_dlp.YoutubeDL(opts) as ydl:
+                    with self._probe_ydl() as ydl:
                         return cast(Dict[str, Any], ydl.extract_info(url, download=False))
                 except DownloadError as e:
-                    if any(kw in str(e).lower() for kw in ["sign in", "members only", "private", "age"]):
-                        return self._fallback_extract_with_cookies(url, opts)
+                    if any(kw in str(e).lower() for kw in _AUTH_ERROR_MARKERS):
+                        return self._fallback_extract_with_cookies(url, self._probe_opts())
                     raise ExtractionError(str(e)) from e
         
         raw_info = self._circuit_breaker.execute(_extract)
@@ -404,43 +566,42 @@ class YtDlpAdapter(MediaExtractorPort):
             SessionStateManager.cleanup_ephemeral_cookie_jar(ephemeral_cookie)
 
     def _map_to_entity(self, info: Dict[str, Any]) -> NormalizedMediaEntity:
-        is_playlist = info.get('_type') == 'playlist' or 'entries' in info
-        canonical_id = info.get('webpage_url') or info.get('url') or info.get('id', '')
+        get = info.get
+        canonical_id = get('webpage_url') or get('url') or get('id', '')
+        uploader = get('uploader', 'Unknown')
+        channel = get('channel') or get('uploader')
         
-        if is_playlist:
+        if get('_type') == 'playlist' or 'entries' in info:
             return NormalizedMediaEntity(
-                original_id=canonical_id, title=info.get('title', 'Unknown Playlist'), artist=info.get('uploader', 'Unknown'),
-                album=info.get('title', ''), is_playlist=True, channel=info.get('channel') or info.get('uploader'),
-                children=[self._map_to_entity(entry) for entry in info.get('entries', []) if entry]
+                original_id=canonical_id, title=get('title', 'Unknown Playlist'), artist=uploader,
+                album=get('title', ''), is_playlist=True, channel=channel,
+                children=[self._map_to_entity(entry) for entry in get('entries') or () if entry]
             )
         
-        thumbnails = info.get('thumbnails', [])
-        best_thumb_url = info.get('thumbnail')
-        
-        if thumbnails:
-            valid_thumbs = [t for t in thumbnails if t.get('width') and t.get('height') and 'url' in t]
-            if valid_thumbs:
-                best_thumb_url = max(valid_thumbs, key=lambda t: t['width'] * t['height'])['url']
+        best_thumb_url = get('thumbnail')
+        valid_thumbs = [t for t in get('thumbnails') or () if t.get('width') and t.get('height') and 'url' in t]
+        if valid_thumbs:
+            best_thumb_url = max(valid_thumbs, key=lambda t: t['width'] * t['height'])['url']
 
         return NormalizedMediaEntity(
-            original_id=canonical_id, title=info.get('title', 'Unknown'), artist=info.get('artist', info.get('uploader', 'Unknown')),
-            album=info.get('album', ''), duration=float(info.get('duration', 0.0) or 0.0), thumbnail_url=best_thumb_url,
-            is_playlist=False, upload_date=info.get('upload_date'), description=info.get('description'),
-            width=info.get('width'), height=info.get('height'), fps=info.get('fps'), channel=info.get('channel') or info.get('uploader'),
-            filesize=info.get('filesize_approx') or info.get('filesize') or 0
+            original_id=canonical_id, title=get('title', 'Unknown'), artist=get('artist', uploader),
+            album=get('album', ''), duration=float(get('duration') or 0.0), thumbnail_url=best_thumb_url,
+            is_playlist=False, upload_date=get('upload_date'), description=get('description'),
+            width=get('width'), height=get('height'), fps=get('fps'), channel=channel,
+            filesize=get('filesize_approx') or get('filesize') or 0
         )
 
     @classmethod
-    def fetch_thumbnail(cls, url: str) -> Optional[bytes]:
+    def fetch_thumbnail(cls, url: str, timeout: float = 15) -> Optional[bytes]:
         try:
-            ctx = ssl.create_default_context()
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=15, context=ctx) as resp:
-                return bytes(resp.read())
+            resp = _get_http_session().get(url, timeout=timeout)
+            resp.raise_for_status()
+            return resp.content
         except Exception:
             return None
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_tls_target() -> Optional[ImpersonateTarget]:
         if not _HAS_CURL_CFFI: return None
         try:
@@ -450,15 +611,24 @@ class YtDlpAdapter(MediaExtractorPort):
         except Exception: pass
         return None
 
+_FFMPEG_BINARIES: Dict[str, str] = {}
+
+def resolve_ffmpeg_binary(hint: str = '') -> Optional[str]:
+    # Only hits are cached: an ffmpeg installed while the app runs is picked up by the next job.
+    if (path := _FFMPEG_BINARIES.get(hint)) is None and (path := shutil.which(hint or 'ffmpeg')):
+        _FFMPEG_BINARIES[hint] = path
+    return path
+
 class FFmpegCommandBuilder:
     _PCM_MAP: Final[Dict[str, str]] = {"16": "pcm_s16le", "24": "pcm_s24le", "32": "pcm_s32le"}
+    _LOUDNORM_FILTER: Final[str] = "loudnorm=I=-14:TP=-1.5:LRA=11"
 
     def __init__(self, config: DownloadJobConfig, source_path: Path, dest_path: Path, cover_path: Optional[Path]):
         self.config = config
         self.source_path = source_path
         self.dest_path = dest_path
         self.cover_path = cover_path
-        self._cmd: List[str] = [config.ffmpeg_path or 'ffmpeg', '-y', '-i', str(source_path)]
+        self._cmd: List[str] = [resolve_ffmpeg_binary(config.ffmpeg_path) or config.ffmpeg_path or 'ffmpeg', '-y', '-i', str(source_path)]
 
     def build(self) -> List[str]:
         self._apply_inputs()
@@ -469,35 +639,35 @@ class FFmpegCommandBuilder:
         return self._cmd
 
     def _apply_inputs(self) -> None:
-        if self.cover_path: self._cmd.extend(['-i', str(self.cover_path)])
+        if self.cover_path: self._cmd.extend(('-i', str(self.cover_path)))
 
     def _apply_audio_codecs(self) -> None:
         ext = self.config.format_container
         bit_depth = str(self.config.audio_bit_depth)
         
         if ext == 'flac': 
-            self._cmd.extend(['-c:a', 'flac'])
+            self._cmd.extend(('-c:a', 'flac'))
             if bit_depth not in ("auto", "16"):
                 fmt = 's32' if bit_depth in ("24", "32") else f's{bit_depth}'
-                self._cmd.extend(['-sample_fmt', fmt])
+                self._cmd.extend(('-sample_fmt', fmt))
         elif ext == 'wav': 
             codec = self._PCM_MAP.get(bit_depth, 'pcm_s16le')
-            self._cmd.extend(['-c:a', codec]) 
-        elif ext in ['mp3', 'm4a', 'aac']:
-            self._cmd.extend(['-c:a', 'aac' if ext in ['m4a', 'aac'] else 'libmp3lame'])
-            if self.config.audio_bitrate != '0': self._cmd.extend(['-b:a', f"{self.config.audio_bitrate}k"])
+            self._cmd.extend(('-c:a', codec)) 
+        elif ext in _LOSSY_CONTAINERS:
+            self._cmd.extend(('-c:a', 'aac' if ext in _AAC_CONTAINERS else 'libmp3lame'))
+            if self.config.audio_bitrate != '0': self._cmd.extend(('-b:a', f"{self.config.audio_bitrate}k"))
 
     def _apply_audio_filters(self) -> None:
         filters, aresample_opts = [], []
         bit_depth = str(self.config.audio_bit_depth)
         
         if self.config.audio_sample_rate > 0: aresample_opts.append(f"osr={self.config.audio_sample_rate}")
-        if self.config.format_container in ['flac', 'wav'] and bit_depth != 'auto':
+        if self.config.format_container in _LOSSLESS_CONTAINERS and bit_depth != 'auto':
             osf_fmt = 's32' if bit_depth in ("24", "32") else 's16'
             aresample_opts.extend([f"osf={osf_fmt}", "dither_method=triangular"])
         if aresample_opts: filters.append(f"aresample={':'.join(aresample_opts)}")
-        if self.config.normalize_audio: filters.append("loudnorm=I=-14:TP=-1.5:LRA=11")
-        if filters: self._cmd.extend(['-af', ','.join(filters)])
+        if self.config.normalize_audio: filters.append(self._LOUDNORM_FILTER)
+        if filters: self._cmd.extend(('-af', ','.join(filters)))
 
     def _apply_metadata(self) -> None:
         if not self.config.embed_metadata: return
@@ -507,23 +677,27 @@ class FFmpegCommandBuilder:
             'genre': self.config.meta_genre, 'comment': self.config.meta_desc
         }
         for k, v in meta_dict.items():
-            if v: self._cmd.extend(['-metadata', f"{k}={v}"])
+            if v: self._cmd.extend(('-metadata', f"{k}={v}"))
         if self.config.meta_date:
-            self._cmd.extend(['-metadata', f"date={str(self.config.meta_date[:4]).strip()}"])
+            self._cmd.extend(('-metadata', f"date={str(self.config.meta_date[:4]).strip()}"))
 
     def _apply_mapping_and_output(self) -> None:
         if self.cover_path:
-            self._cmd.extend(['-map', '0:a:0', '-map', '1:v:0'])
-            self._cmd.extend(['-vf', r"crop='min(in_w\,in_h)':'min(in_w\,in_h)'"])
+            self._cmd.extend(('-map', '0:a:0', '-map', '1:v:0'))
+            self._cmd.extend(('-vf', r"crop='min(in_w\,in_h)':'min(in_w\,in_h)'"))
             
-            self._cmd.extend(['-c:v', 'mjpeg', '-disposition:v', 'attached_pic'])
+            self._cmd.extend(('-c:v', 'mjpeg', '-disposition:v', 'attached_pic'))
             if self.config.format_container == 'mp3':
-                self._cmd.extend(['-id3v2_version', '3', '-metadata:s:v', 'title=Album cover', '-metadata:s:v', 'comment=Cover (front)'])
+                self._cmd.extend(('-id3v2_version', '3', '-metadata:s:v', 'title=Album cover', '-metadata:s:v', 'comment=Cover (front)'))
         else: 
-            self._cmd.extend(['-map', '0:a:0'])
+            self._cmd.extend(('-map', '0:a:0'))
         self._cmd.append(str(self.dest_path))
 
 class FFmpegAdapter(AudioProcessorPort):
+    _PIPE_BUFSIZE: Final[int] = 65536
+    _PROGRESS_INTERVAL: Final[float] = 0.05
+    _PROGRESS_ARGS: Final[tuple[str, ...]] = ('-progress', 'pipe:1', '-nostats')
+
     def execute_pipeline(self, config: DownloadJobConfig, state: DownloadJobState, raw_filepath: Path, temp_dir: Path, progress_cb: Callable[[float], None]) -> Path:
         out_filepath = raw_filepath.with_suffix(f".{config.format_container}")
         if raw_filepath.absolute() == out_filepath.absolute():
@@ -534,9 +708,7 @@ class FFmpegAdapter(AudioProcessorPort):
         cover_path = Path(state.custom_cover_path) if state.custom_cover_path and Path(state.custom_cover_path).exists() else None
         cmd_builder = FFmpegCommandBuilder(config, raw_filepath, out_filepath, cover_path)
         cmd_progress = cmd_builder.build()
-        cmd_progress.insert(-1, '-progress')
-        cmd_progress.insert(-1, 'pipe:1')
-        cmd_progress.insert(-1, '-nostats')
+        cmd_progress[-1:-1] = self._PROGRESS_ARGS
 
         timeout_val = max(120, int((config.duration or 300) * 3))
         
@@ -554,25 +726,48 @@ class FFmpegAdapter(AudioProcessorPort):
         startupinfo = subprocess.STARTUPINFO() if os.name == 'nt' else None
         if startupinfo: startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
         
-        error_log = collections.deque(maxlen=50)
+        error_log: collections.deque[str] = collections.deque(maxlen=50)
         with subprocess.Popen(
             cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-            text=True, encoding='utf-8', errors='replace', startupinfo=startupinfo
+            bufsize=self._PIPE_BUFSIZE, startupinfo=startupinfo,
+            creationflags=SUBPROCESS_FLAGS, close_fds=True
         ) as proc:
             assert proc.stdout is not None
-            for line in proc.stdout:
-                if line.startswith('out_time_ms='):
-                    try:
-                        elapsed_ms = int(line.split('=')[1])
-                        pct = min(100.0, (elapsed_ms / 1_000_000) / max(real_duration, 1.0) * 100)
-                        progress_cb(pct)
-                    except ValueError: pass
-                elif line.strip(): error_log.append(line.strip())
-            
+            pending = bytearray()
+            latest_pct: Optional[float] = None
+            last_emit = 0.0
+            while chunk := proc.stdout.read1(self._PIPE_BUFSIZE):
+                pending += chunk
+                end = pending.rfind(b'\n')
+                if end < 0: continue
+                for raw in bytes(pending[:end]).split(b'\n'):
+                    pct = self._consume_line(raw.decode('utf-8', 'replace'), real_duration, error_log)
+                    if pct is not None: latest_pct = pct
+                del pending[:end + 1]
+
+                now = time.monotonic()
+                if latest_pct is not None and now - last_emit >= self._PROGRESS_INTERVAL:
+                    progress_cb(latest_pct)
+                    latest_pct, last_emit = None, now
+            if pending:
+                pct = self._consume_line(pending.decode('utf-8', 'replace'), real_duration, error_log)
+                if pct is not None: latest_pct = pct
+            if latest_pct is not None: progress_cb(latest_pct)
+
             proc.wait(timeout=timeout)
             if proc.returncode != 0:
                 raise subprocess.CalledProcessError(proc.returncode, cmd, stderr='\n'.join(error_log))
 
+    @staticmethod
+    def _consume_line(line: str, real_duration: float, error_log: collections.deque[str]) -> Optional[float]:
+        if line.startswith('out_time_ms='):
+            try:
+                elapsed_ms = int(line.split('=')[1])
+                return min(100.0, (elapsed_ms / 1_000_000) / max(real_duration, 1.0) * 100)
+            except ValueError: pass
+        elif line.strip(): error_log.append(line.strip())
+        return None
+
     def _cleanup_intermediates(self, raw_path: Path, out_path: Path, cover_path: Optional[Path]) -> None:
         def safe_delete(p: Path) -> None:
             if not p or not p.exists(): return
@@ -587,25 +782,44 @@ class FFmpegAdapter(AudioProcessorPort):
 # ============================================================================
 class PyQtMessageBroker(IMediaBroker):
     def __init__(self, signals: WorkerSignals): self.signals = signals
-    def emit_finished(self) -> None: self.signals.finished.emit()
+    def emit_finished(self, aborted: bool = False) -> None: self.signals.finished.emit()
     def emit_error(self, message: str) -> None: self.signals.error.emit(message)
     def emit_result(self, result: Any) -> None: self.signals.result.emit(result)
     def emit_progress(self, job_id: str, percent: float, speed: str) -> None: self.signals.progress.emit(job_id, percent, speed)
     def emit_status(self, job_id: str, status: str) -> None: self.signals.status.emit(job_id, status)
-    def emit_thumbnail(self, data: bytes) -> None: self.signals.thumbnail_data.emit(data)
+    def emit_thumbnail(self, image: QImage, cover_path: str, token: int) -> None: self.signals.thumbnail_image.emit(image, cover_path, token)
+
+class PyQtJobMessageBroker(PyQtMessageBroker):
+    def __init__(self, signals: WorkerSignals, job_id: str):
+        super().__init__(signals)
+        self.job_id = job_id
+    def emit_finished(self, aborted: bool = False) -> None: self.signals.job_finished.emit(self.job_id, aborted)
+    def emit_error(self, message: str) -> None: self.signals.job_error.emit(self.job_id, message)
 
 class WorkerSignals(QObject):
     finished = pyqtSignal()
     error = pyqtSignal(str)
+    job_finished = pyqtSignal(str, bool)
+    job_error = pyqtSignal(str, str)
     result = pyqtSignal(object)
     progress = pyqtSignal(str, float, str)
     status = pyqtSignal(str, str)
-    thumbnail_data = pyqtSignal(bytes)
+    thumbnail_image = pyqtSignal(QImage, str, int)
 
 class AnalysisWorker(QRunnable):
-    def __init__(self, url: str) -> None:
+    _THUMB_CACHE_SIZE: Final[int] = 16
+    _THUMB_MAX_SIZE: Final[QSize] = QSize(1280, 1280)
+    _THUMB_FETCH_TIMEOUT: Final[float] = 5.0
+    _PREVIEW_SIZE: Final[QSize] = QSize(640, 360)
+    _thumb_cache: collections.OrderedDict[str, QImage] = collections.OrderedDict()
+    _thumb_cache_lock = threading.Lock()
+    _io_closed = False
+    _io_lock = threading.Lock()
+
+    def __init__(self, url: str, token: int = 0) -> None:
         super().__init__()
         self.url = url
+        self.token = token
         self._signals = WorkerSignals()
         self.broker = PyQtMessageBroker(self._signals)
         self.spotify_adapter = SpotifyAdapter()
@@ -624,8 +838,7 @@ class AnalysisWorker(QRunnable):
             self.broker.emit_result(entity)
             
             if entity.thumbnail_url and not entity.is_playlist:
-                data = YtDlpAdapter.fetch_thumbnail(entity.thumbnail_url)
-                if data: self.broker.emit_thumbnail(data)
+                self._submit_thumbnail(entity.thumbnail_url)
         except MediaSystemError as e:
             self.broker.emit_error(str(e))
         except Exception as e:
@@ -633,6 +846,66 @@ class AnalysisWorker(QRunnable):
         finally:
             self.broker.emit_finished()
 
+    def _submit_thumbnail(self, url: str) -> None:
+        # Only the broker and token travel to the I/O thread; the runnable itself is auto-deleted after run().
+        with self._io_lock:
+            if not self._io_closed:
+                _IO_POOL.submit(type(self)._deliver_thumbnail, self.broker, self.token, url)
+
+    @classmethod
+    def _deliver_thumbnail(cls, broker: IMediaBroker, token: int, url: str) -> None:
+        try:
+            if not (image := cls._load_thumbnail(url)): return
+            cover_path = cls._persist_cover(image)
+            preview = image.scaled(cls._PREVIEW_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            with cls._io_lock:
+                if not cls._io_closed:
+                    broker.emit_thumbnail(preview, cover_path, token)
+                    return
+            if cover_path: Path(cover_path).unlink(missing_ok=True)
+        except Exception as e:
+            logging.debug("[Network] Falha ao obter miniatura: %s", e)
+
+    @classmethod
+    def close_thumbnail_io(cls) -> None:
+        with cls._io_lock: cls._io_closed = True
+        _IO_POOL.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _load_thumbnail(cls, url: str) -> Optional[QImage]:
+        with cls._thumb_cache_lock:
+            if (hit := cls._thumb_cache.get(url)) is not None:
+                cls._thumb_cache.move_to_end(url)
+                return hit
+
+        if not (data := YtDlpAdapter.fetch_thumbnail(url, cls._THUMB_FETCH_TIMEOUT)): return None
+        buf = QBuffer()
+        buf.setData(QByteArray(data))
+        buf.open(QIODevice.OpenModeFlag.ReadOnly)
+        reader = QImageReader(buf)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.width() > cls._THUMB_MAX_SIZE.width() or size.height() > cls._THUMB_MAX_SIZE.height():
+            reader.setScaledSize(size.scaled(cls._THUMB_MAX_SIZE, Qt.AspectRatioMode.KeepAspectRatio))
+        if (image := reader.read()).isNull(): return None
+
+        with cls._thumb_cache_lock:
+            cls._thumb_cache[url] = image
+            while len(cls._thumb_cache) > cls._THUMB_CACHE_SIZE:
+                cls._thumb_cache.popitem(last=False)
+        return image
+
+    @staticmethod
+    def _persist_cover(image: QImage) -> str:
+        if shutil.disk_usage(tempfile.gettempdir()).free < 5_000_000:
+            logging.warning("[I/O] Espaço em disco insuficiente para cache de miniaturas.")
+            return ""
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg", prefix="cover_sndstream_") as f:
+            tmp = Path(f.name)
+        if image.convertToFormat(QImage.Format.Format_RGB32).save(str(tmp), "JPG", 95): return str(tmp)
+        tmp.unlink(missing_ok=True)
+        return ""
+
 class WorkspaceManager:
     def __init__(self, base_dir: Path, job_id: str):
         self.temp_dir = base_dir / ".inprogress" / job_id
@@ -664,17 +937,89 @@ class CoverArtResolver:
                 f.write(raw)
             state.custom_cover_path = path
 
+_OUTTMPL_NAME: Final[str] = "%(title)s - %(uploader)s [%(id)s].%(ext)s"
+_BASE_YTDLP_OPTS: Final[MappingProxyType[str, Any]] = MappingProxyType({
+    'quiet': True, 'no_warnings': False,
+    'source_address': '0.0.0.0', 'javascript_executor': 'deno',
+})
+
+_FORMAT_SELECTORS: Final[Dict[MediaType, str]] = {
+    MediaType.AUDIO: 'bestaudio/best',
+    MediaType.VIDEO: 'bestvideo+bestaudio/best',
+}
+
+_YTDLP_FLAG_MAP: Final[Dict[str, Dict[str, Any]]] = {
+    "--force-ipv4": {"source_address": "0.0.0.0"},
+    "--force-ipv6": {"source_address": "::"},
+    "--geo-bypass": {"geo_bypass": True},
+    "--no-overwrites": {"nooverwrites": True},
+    "--ignore-errors": {"ignoreerrors": True},
+    "--no-warnings": {"no_warnings": True},
+    "--restrict-filenames": {"restrictfilenames": True},
+    "--windows-filenames": {"windowsfilenames": True},
+    "--continue": {"continuedl": True},
+    "--write-subs": {"writesubtitles": True},
+    "--write-auto-subs": {"writeautomaticsub": True},
+    "--write-info-json": {"writeinfojson": True}
+}
+
+def _set_opt(key: str, convert: Callable[[str], Any] = str) -> Callable[[Dict[str, Any], str], None]:
+    def _apply(opts: Dict[str, Any], val: str) -> None: opts[key] = convert(val)
+    return _apply
+
+_EXTRACTOR_ARG_SPLIT: Final[re.Pattern[str]] = re.compile(r'(?<!\\),')
+
+def _apply_extractor_args(opts: Dict[str, Any], val: str) -> None:
+    extractor, sep, rest = val.partition(':')
+    if not sep: return
+    ie_args: Dict[str, List[str]] = opts.setdefault('extractor_args', {}).setdefault(extractor.strip().lower(), {})
+    for pair in rest.split(';'):
+        arg_k, _, arg_v = pair.partition('=')
+        if not (key := arg_k.strip().lower().replace('-', '_')): continue
+        ie_args[key] = [v.replace(r'\,', ',').strip() for v in _EXTRACTOR_ARG_SPLIT.split(arg_v)]
+
+_YTDLP_VALUE_FLAGS: Final[Dict[str, Callable[[Dict[str, Any], str], None]]] = {
+    "--proxy": _set_opt("proxy"),
+    "--limit-rate": _set_opt("ratelimit"),
+    "--socket-timeout": _set_opt("socket_timeout", float),
+    "--concurrent-fragments": _set_opt("concurrent_fragment_downloads", int),
+    "--match-filter": _set_opt("match_filter", lambda expr: match_filter_func(expr)),
+    "--extractor-args": _apply_extractor_args
+}
+
+@lru_cache(maxsize=16)
+def _parse_custom_flags(custom_flags: str) -> tuple[tuple[str, Optional[str]], ...]:
+    if not custom_flags: return ()
+    try: tokens = shlex.split(custom_flags)
+    except ValueError: tokens = custom_flags.split()
+
+    parsed: List[tuple[str, Optional[str]]] = []
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok in _YTDLP_FLAG_MAP:
+            parsed.append((tok, None))
+        elif tok in _YTDLP_VALUE_FLAGS and i + 1 < len(tokens):
+            parsed.append((tok, tokens[i + 1])); i += 1
+        i += 1
+    return tuple(parsed)
+
 class DownloadWorker(QRunnable):
+    _PROGRESS_STEP: Final[float] = 0.5
+    _PROGRESS_INTERVAL: Final[float] = 0.1
+
     def __init__(self, config: DownloadJobConfig, app_config: AppConfig = _APP_CONFIG) -> None:
         super().__init__()
         self.config = config
         self._app_config = app_config
         self.state = DownloadJobState()
         self._signals = WorkerSignals()
-        self.broker = PyQtMessageBroker(self._signals)
+        self.broker = PyQtJobMessageBroker(self._signals, config.job_id)
         self._abort_event = threading.Event()
         self._workspace = WorkspaceManager(self.config.output_path, self.config.job_id)
-        self._logger = StructuredLogger(__name__, self.config.job_id[:8])
+        self._logger = StructuredLogger(_LOGGER, self.config.job_id[:8])
+        self._last_pct = -1.0
+        self._last_emit_ts = 0.0
 
     @property
     def signals(self) -> WorkerSignals: return self._signals
@@ -686,7 +1031,9 @@ class DownloadWorker(QRunnable):
     @pyqtSlot()
     def run(self) -> None:
         temp_dir = self._workspace.setup()
+        aborted = False
         try:
+            _ensure_ytdlp()
             self.broker.emit_status(self.config.job_id, "Iniciando orquestração...")
             CoverArtResolver.resolve(self.config, self.state)
             
@@ -701,40 +1048,46 @@ class DownloadWorker(QRunnable):
                     lambda pct: self.broker.emit_progress(self.config.job_id, pct, "Processamento DSP")
                 )
 
+            self._check_abort()
             self._atomic_finalize_move(temp_dir)
             self.broker.emit_status(self.config.job_id, "Pipeline concluído com sucesso.")
 
         except MediaSystemError as e:
-            if not self._abort_event.is_set():
+            if not (aborted := self._abort_event.is_set()):
                 self._logger.error("Falha no Domínio MediaSystem", exc_info=True)
                 self.broker.emit_error(str(e))
         except Exception as e:
-            if not self._abort_event.is_set():
+            if not (aborted := self._abort_event.is_set()):
                 self._logger.error("Falha não tratada", exc_info=True)
                 self.broker.emit_error(f"Erro Crítico: {e}")
         finally:
             SessionStateManager.cleanup_ephemeral_cookie_jar(self.state.ephemeral_cookie)
             self._workspace.teardown()
-            self.broker.emit_finished()
+            self.broker.emit_finished(aborted)
 
     def _progress_hook(self, d: dict[str, Any]) -> None:
         self._check_abort()
         status = d.get('status')
         if status == 'downloading':
-            p = d.get('_percent_str', '0%').replace('%', '')
-            try: percent = float(p)
-            except ValueError: percent = 0.0
-            self.broker.emit_progress(self.config.job_id, percent, d.get('_speed_str', 'N/A'))
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            percent = (d.get('downloaded_bytes') or 0) * 100.0 / total if total else 0.0
+            now = time.monotonic()
+            if now - self._last_emit_ts < self._PROGRESS_INTERVAL: return
+            if total and abs(percent - self._last_pct) < self._PROGRESS_STEP: return
+            self._last_pct, self._last_emit_ts = percent, now
+            speed = d.get('speed')
+            self.broker.emit_progress(self.config.job_id, percent, f"{speed / 1048576:.2f}MiB/s" if speed else 'N/A')
         elif status == 'finished':
             self.broker.emit_progress(self.config.job_id, 100.0, "Escrita final...")
 
     def _build_opts(self, temp_dir: Path) -> Dict[str, Any]:
-        out_tmpl = str(temp_dir / f"%(title)s - %(uploader)s [%(id)s].%(ext)s")
+        out_tmpl = os.path.join(temp_dir, _OUTTMPL_NAME)
         opts: Dict[str, Any] = {
+            **_BASE_YTDLP_OPTS,
             'outtmpl': out_tmpl, 'progress_hooks': [self._progress_hook],
-            'quiet': True, 'no_warnings': False, 'socket_timeout': self._app_config.network_timeout,
-            'source_address': '0.0.0.0', 'javascript_executor': 'deno',
-            'format': 'bestaudio/best' if self.config.media_type == MediaType.AUDIO else 'bestvideo+bestaudio/best',
+            'socket_timeout': self._app_config.network_timeout,
+            'concurrent_fragment_downloads': self._app_config.concurrent_fragments,
+            'format': _FORMAT_SELECTORS[self.config.media_type],
             'merge_output_format': self.config.format_container if self.config.media_type == MediaType.VIDEO else None
         }
         if self.config.ffmpeg_path: opts['ffmpeg_location'] = self.config.ffmpeg_path
@@ -742,46 +1095,9 @@ class DownloadWorker(QRunnable):
             self.state.ephemeral_cookie = SessionStateManager.create_ephemeral_cookie_jar()
             if self.state.ephemeral_cookie: opts['cookiefile'] = self.state.ephemeral_cookie
 
-        if self.config.custom_flags:
-            try: extra_tokens = shlex.split(self.config.custom_flags)
-            except ValueError: extra_tokens = self.config.custom_flags.split()
-            
-            _FLAG_MAP: Final = {
-                "--force-ipv4": {"source_address": "0.0.0.0"},
-                "--force-ipv6": {"source_address": "::"},
-                "--geo-bypass": {"geo_bypass": True},
-                "--no-overwrites": {"nooverwrites": True},
-                "--ignore-errors": {"ignoreerrors": True},
-                "--no-warnings": {"no_warnings": True},
-                "--restrict-filenames": {"restrictfilenames": True},
-                "--windows-filenames": {"windowsfilenames": True},
-                "--continue": {"continuedl": True},
-                "--write-subs": {"writesubtitles": True},
-                "--write-auto-subs": {"writeautomaticsub": True},
-                "--write-info-json": {"writeinfojson": True}
-            }
-            i = 0
-            while i < len(extra_tokens):
-                tok = extra_tokens[i]
-                if tok in _FLAG_MAP:
-                    opts.update(_FLAG_MAP[tok])
-                elif tok == "--proxy" and i + 1 < len(extra_tokens):
-                    opts["proxy"] = extra_tokens[i + 1]; i += 1
-                elif tok == "--limit-rate" and i + 1 < len(extra_tokens):
-                    opts["ratelimit"] = extra_tokens[i + 1]; i += 1
-                elif tok == "--socket-timeout" and i + 1 < len(extra_tokens):
-                    opts["socket_timeout"] = float(extra_tokens[i + 1]); i += 1
-                elif tok == "--match-filter" and i + 1 < len(extra_tokens):
-                    from yt_dlp.utils import match_filter_func
-                    opts["match_filter"] = match_filter_func(extra_tokens[i + 1]); i += 1
-                elif tok == "--extractor-args" and i + 1 < len(extra_tokens):
-                    val = extra_tokens[i + 1]
-                    if ':' in val and '=' in val:
-                        extractor, rest = val.split(':', 1)
-                        arg_k, arg_v = rest.split('=', 1)
-                        opts.setdefault('extractor_args', {}).setdefault(extractor, {}).setdefault(arg_k, []).append(arg_v)
-                    i += 1
-                i += 1
+        for tok, val in _parse_custom_flags(self.config.custom_flags):
+            if val is None: opts.update(_YTDLP_FLAG_MAP[tok])
+            else: _YTDLP_VALUE_FLAGS[tok](opts, val)
         return opts
 
     def _execute_download(self, opts: Dict[str, Any], temp_dir: Path) -> Optional[Path]:
@@ -794,7 +1110,7 @@ class DownloadWorker(QRunnable):
             info = YtDlpAdapter._circuit_breaker.execute(lambda: _dl(opts))
         except DownloadError as e:
             err_msg = str(e).lower()
-            if not self.config.use_browser_cookies and any(kw in err_msg for kw in ["sign in", "members only", "private", "age"]):
+            if not self.config.use_browser_cookies and any(kw in err_msg for kw in _AUTH_ERROR_MARKERS):
                 self._logger.warning("Restrição de acesso detectada. Iniciando mitigação automática via matriz de cookies local.")
                 ephemeral_cookie = SessionStateManager.create_ephemeral_cookie_jar()
                 if ephemeral_cookie:
@@ -811,30 +1127,40 @@ class DownloadWorker(QRunnable):
         
         filepath = info.get('filepath') or info.get('_filename')
         if filepath: return Path(filepath)
-        files = [f for f in temp_dir.iterdir() if f.is_file() and not f.name.endswith(('.part', '.ytdl'))]
-        if files: return sorted(files, key=lambda x: x.stat().st_size, reverse=True)[0]
-        return None
+        with os.scandir(temp_dir) as it:
+            files = [e for e in it if e.is_file(follow_symlinks=False) and not e.name.lower().endswith(_PARTIAL_SUFFIXES)]
+        return Path(max(files, key=lambda e: e.stat().st_size).path) if files else None
 
     def _atomic_finalize_move(self, temp_dir: Path) -> None:
         dest_dir = self.config.output_path
         dest_dir.mkdir(parents=True, exist_ok=True)
         moved_files = []
-        for file_p in temp_dir.iterdir():
-            if not file_p.is_file() or file_p.suffix.lower() in {".part", ".ytdl"}: continue
+        with os.scandir(temp_dir) as it:
+            entries = [e for e in it if e.is_file(follow_symlinks=False)]
+        for entry in entries:
+            if entry.name.lower().endswith(_PARTIAL_SUFFIXES): continue
+            suffix = os.path.splitext(entry.name)[1]
             
             counter = 0
             while True:
-                name = f"{self.state.custom_filename}{f' ({counter})' if counter else ''}{file_p.suffix}"
+                name = f"{self.state.custom_filename}{f' ({counter})' if counter else ''}{suffix}"
                 target = dest_dir / name
                 try:
-                    fd = os.open(str(target), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
-                    os.close(fd)
-                    target.unlink()
-                    shutil.move(str(file_p), str(target))
-                    moved_files.append(target)
-                    break
+                    os.close(os.open(str(target), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
                 except FileExistsError:
                     counter += 1
+                    continue
+                try:
+                    try:
+                        os.replace(entry.path, target)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV: raise
+                        shutil.move(entry.path, target)
+                except OSError:
+                    target.unlink(missing_ok=True)
+                    raise
+                moved_files.append(target)
+                break
             
         if moved_files:
             target_out = next((f for f in moved_files if f.suffix.lower() == f".{self.config.format_container.lower()}"), moved_files[0])
@@ -0,0 +1,89 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+
+from main import DownloadQueueModel, UrlResolver
+
+class TestUrlResolver(unittest.TestCase):
+    def test_accepts_supported_media_hosts(self):
+        self.assertTrue(UrlResolver.validate_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ"))
+        self.assertTrue(UrlResolver.validate_url("https://youtu.be/dQw4w9WgXcQ"))
+        self.assertTrue(UrlResolver.validate_url("https://music.youtube.com/watch?v=123"))
+        self.assertTrue(UrlResolver.validate_url("http://soundcloud.com/artist/track"))
+        self.assertTrue(UrlResolver.validate_url("https://open.spotify.com/track/4PTG3Z6ehGkBFwjybzWkR8"))
+
+    def test_accepts_search_prefixes(self):
+        self.assertTrue(UrlResolver.validate_url("ytsearch:some song"))
+        self.assertTrue(UrlResolver.validate_url("ytmsearch1:some song"))
+
+    def test_missing_scheme_is_accepted_for_known_hosts(self):
+        self.assertTrue(UrlResolver.validate_url("youtube.com/watch?v=dQw4w9WgXcQ"))
+        self.assertTrue(UrlResolver.validate_url("www.youtu.be/dQw4w9WgXcQ"))
+
+    def test_rejects_other_schemes(self):
+        self.assertFalse(UrlResolver.validate_url("ftp://youtube.com/watch?v=123"))
+        self.assertFalse(UrlResolver.validate_url("file://youtube.com/watch"))
+
+    def test_rejects_urls_without_a_path(self):
+        self.assertFalse(UrlResolver.validate_url("https://youtube.com"))
+        self.assertFalse(UrlResolver.validate_url("https://youtube.com/"))
+
+    def test_rejects_embedded_newlines(self):
+        self.assertFalse(UrlResolver.validate_url("https://youtu.be/dQw4w9WgXcQ\n"))
+        self.assertFalse(UrlResolver.validate_url("https://youtu.be/abc\nhttps://evil.com/x"))
+
+    def test_rejects_lookalike_hosts(self):
+        self.assertFalse(UrlResolver.validate_url("https://www.google.com/search?q=youtube"))
+        self.assertFalse(UrlResolver.validate_url("https://youtube.com.evil.com/watch?v=1"))
+        self.assertFalse(UrlResolver.validate_url("https://evil.com/youtube.com/watch?v=1"))
+        self.assertFalse(UrlResolver.validate_url("https://youtube.com:443/watch?v=1"))
+        self.assertFalse(UrlResolver.validate_url("not a url"))
+
+class TestDownloadQueueModel(unittest.TestCase):
+    def setUp(self):
+        self.model = DownloadQueueModel()
+        self.model.add_jobs([("a", "A.mp3", "MP3"), ("b", "B.flac", "FLAC"), ("c", "C.mp4", "MP4 (1080p)")])
+
+    def test_add_jobs_appends_rows_and_indexes_them(self):
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual([self.model.row_of(j) for j in "abc"], [0, 1, 2])
+        self.assertEqual(self.model.job_id_at(2), "c")
+        self.assertEqual(self.model.index(1, DownloadQueueModel.COL_TITLE).data(), "B.flac")
+        self.assertEqual(self.model.index(1, DownloadQueueModel.COL_ACTION).data(), "Parar")
+        self.assertEqual(self.model.index(1, 0).data(Qt.ItemDataRole.UserRole), "b")
+        self.assertEqual(self.model.status_of("a"), "Na Fila")
+
+    def test_remove_job_reindexes_following_rows(self):
+        self.model.remove_job("a")
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(self.model.row_of("a"), -1)
+        self.assertEqual(self.model.row_of("b"), 0)
+        self.assertEqual(self.model.row_of("c"), 1)
+        self.assertEqual(self.model.job_id_at(1), "c")
+
+    def test_unknown_jobs_are_ignored(self):
+        self.model.remove_job("missing")
+        self.model.set_status("missing", "✔ Concluído")
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.status_of("missing"), "")
+
+    def test_updates_emit_a_single_cell_change_only_when_values_differ(self):
+        changes = []
+        self.model.dataChanged.connect(lambda tl, br, roles: changes.append((tl.row(), tl.column(), br.row(), br.column())))
+        self.model.set_progress("b", 42.7)
+        self.model.set_progress("b", 42.2)
+        self.model.set_status("b", "Na Fila")
+        self.assertEqual(changes, [(1, DownloadQueueModel.COL_PROGRESS, 1, DownloadQueueModel.COL_PROGRESS)])
+        self.assertEqual(self.model.index(1, DownloadQueueModel.COL_PROGRESS).data(DownloadQueueModel.ProgressRole), 42)
+
+    def test_job_ids_with_status_filters_rows(self):
+        self.model.set_status("a", "✔ Concluído")
+        self.model.set_status("c", "Cancelado")
+        self.assertEqual(self.model.job_ids_with_status(frozenset({"✔ Concluído", "Cancelado"})), ["a", "c"])
+
+
+if __name__ == '__main__':
+    unittest.main()
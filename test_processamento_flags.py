@@ -0,0 +1,52 @@
+import unittest
+
+from processamento import _apply_extractor_args, _parse_custom_flags
+
+class TestParseCustomFlags(unittest.TestCase):
+    def test_empty_input_yields_no_flags(self):
+        self.assertEqual(_parse_custom_flags(""), ())
+
+    def test_boolean_and_value_flags_are_paired(self):
+        parsed = _parse_custom_flags('--force-ipv4 --proxy "socks5://127.0.0.1:9050" --socket-timeout 30')
+        self.assertEqual(parsed, (
+            ("--force-ipv4", None),
+            ("--proxy", "socks5://127.0.0.1:9050"),
+            ("--socket-timeout", "30"),
+        ))
+
+    def test_unknown_tokens_and_dangling_values_are_ignored(self):
+        self.assertEqual(_parse_custom_flags("--not-a-flag value --proxy"), ())
+
+    def test_unbalanced_quotes_fall_back_to_whitespace_split(self):
+        self.assertEqual(_parse_custom_flags('--force-ipv4 "unterminated'), (("--force-ipv4", None),))
+
+class TestApplyExtractorArgs(unittest.TestCase):
+    def test_matches_ytdlp_cli_semantics(self):
+        opts = {}
+        _apply_extractor_args(opts, "YouTube:Player-Client=android, web;skip=dash")
+        self.assertEqual(opts["extractor_args"], {"youtube": {"player_client": ["android", "web"], "skip": ["dash"]}})
+
+    def test_escaped_commas_stay_in_the_value(self):
+        opts = {}
+        _apply_extractor_args(opts, r"generic:impersonate=chrome\,safari")
+        self.assertEqual(opts["extractor_args"]["generic"]["impersonate"], ["chrome,safari"])
+
+    def test_bare_keys_keep_an_empty_value(self):
+        opts = {}
+        _apply_extractor_args(opts, "youtube:player_skip=webpage;no_check")
+        self.assertEqual(opts["extractor_args"]["youtube"], {"player_skip": ["webpage"], "no_check": [""]})
+
+    def test_repeated_flags_merge_per_extractor_and_last_key_wins(self):
+        opts = {}
+        _apply_extractor_args(opts, "youtube:player_client=android;skip=dash")
+        _apply_extractor_args(opts, "youtube:player_client=web")
+        self.assertEqual(opts["extractor_args"]["youtube"], {"player_client": ["web"], "skip": ["dash"]})
+
+    def test_values_without_an_extractor_are_ignored(self):
+        opts = {}
+        _apply_extractor_args(opts, "no-colon-here")
+        self.assertNotIn("extractor_args", opts)
+
+
+if __name__ == '__main__':
+    unittest.main()